@@ -4,26 +4,43 @@ GitHub API client for interacting with GitHub repositories.
 Provides methods for fetching repository information and managing mirrors.
 """
 
-from typing import Any, Dict, List, Optional
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
 from ..config.config import GitHubConfig, ProxyConfig
 from ..logger.logger import get_logger
 
+# Shared HTTP clients keyed by (api_url, token, proxy_url), so long-lived
+# GitHubClients for the configured token reuse one keep-alive pool. Only
+# clients created with shared_session=True are registered here
+_CLIENT_CACHE: Dict[Tuple[str, Optional[str], Optional[str]], httpx.Client] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
 
 class GitHubClient:
     """Client for interacting with GitHub API."""
 
-    def __init__(self, config: GitHubConfig, log_config=None, proxy_config: Optional[ProxyConfig] = None):
+    def __init__(
+        self,
+        config: GitHubConfig,
+        log_config=None,
+        proxy_config: Optional[ProxyConfig] = None,
+        shared_session: bool = False
+    ):
         """Initialize GitHub client.
 
         Args:
             config: GitHubConfig instance
             log_config: Optional LogConfig for logging
             proxy_config: Optional ProxyConfig for proxy settings
+            shared_session: Reuse the process-wide HTTP session for this
+                endpoint and token (for the configured token only; ad-hoc
+                tokens get a private session that close() releases)
         """
         self.config = config
+        self.shared_session = shared_session
         self.logger = get_logger("github_client", log_config)
 
         # Build headers
@@ -50,6 +67,7 @@ class GitHubClient:
             "timeout": 30.0
         }
 
+        proxy_url = None
         if proxy_config and proxy_config.enabled and proxy_config.url:
             # Format proxy URL with authentication if provided
             proxy_url = proxy_config.url
@@ -61,14 +79,17 @@ class GitHubClient:
             client_kwargs["proxy"] = proxy_url
             self.logger.debug(f"Using proxy: {proxy_config.url}")
 
-        self.session = httpx.Client(**client_kwargs)
+        if not shared_session:
+            self.session = httpx.Client(**client_kwargs)
+            return
 
-    def __del__(self):
-        """Close session on cleanup."""
-        try:
-            self.session.close()
-        except Exception:
-            pass
+        key = (config.api_url, config.token, proxy_url)
+        with _CLIENT_CACHE_LOCK:
+            session = _CLIENT_CACHE.get(key)
+            if session is None or session.is_closed:
+                session = httpx.Client(**client_kwargs)
+                _CLIENT_CACHE[key] = session
+        self.session = session
 
     def get_user(self) -> Dict[str, Any]:
         """Get authenticated user information.
@@ -294,12 +315,30 @@ class GitHubClient:
             raise
 
     def close(self) -> None:
-        """Close the HTTP session."""
-        try:
-            self.session.close()
-            self.logger.debug("GitHub client session closed")
-        except Exception as e:
-            self.logger.error(f"Error closing GitHub client: {e}")
+        """Close the client.
+
+        A shared HTTP session stays open for the other clients using it;
+        use shutdown_all() to close the shared sessions.
+        """
+        if self.shared_session:
+            self.logger.debug("GitHub client released")
+            return
+
+        self.session.close()
+        self.logger.debug("GitHub client closed")
+
+    @staticmethod
+    def shutdown_all() -> None:
+        """Close every shared HTTP session (e.g. on application shutdown)."""
+        with _CLIENT_CACHE_LOCK:
+            sessions = list(_CLIENT_CACHE.values())
+            _CLIENT_CACHE.clear()
+
+        for session in sessions:
+            try:
+                session.close()
+            except Exception:
+                pass
 
 
 async def validate_github_token(config: GitHubConfig) -> bool:
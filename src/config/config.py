@@ -9,6 +9,7 @@ import os
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+import orjson
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field, validator
 
@@ -48,6 +49,14 @@ class SyncConfig(BaseModel):
     timeout: int = Field(default=1800, description="Sync timeout in seconds")
     retry_count: int = Field(default=3, description="Number of retries on failure")
     concurrent_tasks: int = Field(default=3, description="Number of concurrent sync tasks")
+    clone_cache: bool = Field(
+        default=False,
+        description="Keep bare mirrors under <local_path>-cache and clone new repositories by reference"
+    )
+    shallow_mirror: bool = Field(
+        default=False,
+        description="Clone only the latest commit of each branch (the Gitea server must accept shallow pushes)"
+    )
 
     @validator("interval")
     def interval_positive(cls, v: int) -> int:
@@ -61,6 +70,12 @@ class SyncConfig(BaseModel):
             raise ValueError("Timeout must be positive")
         return v
 
+    @validator("shallow_mirror")
+    def shallow_mirror_without_cache(cls, v: bool, values: dict) -> bool:
+        if v and values.get("clone_cache"):
+            raise ValueError("Shallow mirrors cannot be combined with the clone cache")
+        return v
+
 
 class ProxyConfig(BaseModel):
     """Proxy configuration for network requests."""
@@ -209,7 +224,9 @@ class ConfigManager:
             interval=int(self._get_env("SYNC_INTERVAL", default="3600")),
             timeout=int(self._get_env("SYNC_TIMEOUT", default="1800")),
             retry_count=int(self._get_env("SYNC_RETRY_COUNT", default="3")),
-            concurrent_tasks=int(self._get_env("SYNC_CONCURRENT", default="3"))
+            concurrent_tasks=int(self._get_env("SYNC_CONCURRENT", default="3")),
+            clone_cache=self._get_env("SYNC_CLONE_CACHE", default="false").lower() == "true",
+            shallow_mirror=self._get_env("SYNC_SHALLOW_MIRROR", default="false").lower() == "true"
         )
 
         proxy_config = ProxyConfig(
@@ -260,9 +277,8 @@ class ConfigManager:
         """Load repositories from JSON configuration file."""
         if self.repo_config_file.exists():
             try:
-                with open(self.repo_config_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.repositories = {repo["name"]: repo for repo in data.get("repositories", [])}
+                data = orjson.loads(self.repo_config_file.read_bytes())
+                self.repositories = {repo["name"]: repo for repo in data.get("repositories", [])}
             except (json.JSONDecodeError, KeyError) as e:
                 raise ValueError(f"Invalid repositories configuration: {e}")
 
@@ -273,12 +289,11 @@ class ConfigManager:
             repositories: List of repository configurations
         """
         self.repo_config_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.repo_config_file, "w", encoding="utf-8") as f:
-            json.dump({
-                "description": "GitHub 仓库镜像列表配置",
-                "version": "1.2",
-                "repositories": repositories
-            }, f, indent=2, ensure_ascii=False)
+        self.repo_config_file.write_bytes(orjson.dumps({
+            "description": "GitHub 仓库镜像列表配置",
+            "version": "1.2",
+            "repositories": repositories
+        }, option=orjson.OPT_INDENT_2))
         self.repositories = {repo["name"]: repo for repo in repositories}
 
     def validate(self) -> bool:
@@ -35,20 +35,24 @@ class StructuredLogger:
         logger = logging.getLogger(self.name)
         logger.setLevel(self.log_config.level)
 
-        # Clear existing handlers
-        logger.handlers.clear()
-
-        # Create log directory if needed
-        log_file = Path(self.log_config.file_path)
-        log_file.parent.mkdir(parents=True, exist_ok=True)
+        # Close and remove existing handlers so recreating a logger does not
+        # leak the previous log file handle
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            handler.close()
 
         # Console handler with colors
         console_handler = self._create_console_handler()
         logger.addHandler(console_handler)
 
-        # File handler with rotation
-        file_handler = self._create_file_handler()
-        logger.addHandler(file_handler)
+        # File handler with rotation (skipped when no log file is configured)
+        if self.log_config.file_path:
+            # Create log directory if needed
+            log_file = Path(self.log_config.file_path)
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+
+            file_handler = self._create_file_handler()
+            logger.addHandler(file_handler)
 
         return logger
 
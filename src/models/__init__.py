@@ -4,16 +4,28 @@ Database models for GitHub Mirror Sync using SQLAlchemy.
 Defines data models for repositories, sync history, and application configuration.
 """
 
+import re
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Iterator, Optional
 
 from sqlalchemy import Column, DateTime, Float, Integer, String, Text, Boolean, create_engine, UniqueConstraint
+from sqlalchemy import event, func, select
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
 Base = declarative_base()
 
+# Separator of the comma-separated Repository.tags column
+_TAG_SPLIT_RE = re.compile(r",\s*")
+
+# Seconds a cached status count stays valid, so changes the ORM listeners
+# cannot see (other worker processes, Core or bulk writes) still show up
+_STATUS_COUNTS_TTL = 5.0
+
 
 class Repository(Base):
     """Repository model for storing GitHub repository information."""
@@ -62,7 +74,7 @@ class Repository(Base):
             "url": self.url,
             "description": self.description,
             "enabled": self.enabled,
-            "tags": self.tags.split(",") if self.tags else [],
+            "tags": _TAG_SPLIT_RE.split(self.tags) if self.tags else [],
             "local_path": self.local_path,
             "gitea_owner": self.gitea_owner,
             "sync_interval": self.sync_interval,
@@ -194,6 +206,17 @@ class Database:
 
         self.SessionLocal = sessionmaker(bind=self.engine)
 
+        # Cached repository counts by sync status, dropped whenever a commit
+        # touches Repository rows or the TTL expires, recomputed on next read
+        self._status_counts: Optional[Dict[str, int]] = None
+        self._status_counts_expires = 0.0
+        self._status_counts_generation = 0
+        self._status_counts_lock = threading.Lock()
+
+        event.listen(self.SessionLocal, "after_flush", self._track_repository_changes)
+        event.listen(self.SessionLocal, "after_commit", self._on_commit)
+        event.listen(self.SessionLocal, "after_soft_rollback", self._on_rollback)
+
     def init_db(self) -> None:
         """Create all tables in the database."""
         Base.metadata.create_all(self.engine)
@@ -210,6 +233,82 @@ class Database:
         """
         return self.SessionLocal()
 
+    @contextmanager
+    def session_scope(self) -> Iterator[Session]:
+        """Provide a transactional scope around a series of operations.
+
+        Commits on success, rolls back on error and always closes the session.
+
+        Yields:
+            SQLAlchemy session object
+        """
+        session = self.SessionLocal()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def get_sync_status_counts(self) -> Dict[str, int]:
+        """Get the number of repositories per sync status.
+
+        Served from an in-process cache; the SQL aggregation only runs after
+        a commit has changed repository rows or the cached value is older
+        than a few seconds.
+
+        Returns:
+            Dictionary mapping last_sync_status to repository count
+        """
+        with self._status_counts_lock:
+            if self._status_counts is not None and time.monotonic() < self._status_counts_expires:
+                return dict(self._status_counts)
+            generation = self._status_counts_generation
+
+        session = self.SessionLocal()
+        try:
+            rows = session.execute(
+                select(Repository.last_sync_status, func.count())
+                .group_by(Repository.last_sync_status)
+            ).all()
+        finally:
+            session.close()
+
+        counts = {status: count for status, count in rows}
+        with self._status_counts_lock:
+            # Only cache if no commit invalidated the counts meanwhile
+            if generation == self._status_counts_generation:
+                self._status_counts = counts
+                self._status_counts_expires = time.monotonic() + _STATUS_COUNTS_TTL
+        return dict(counts)
+
+    def invalidate_sync_status_counts(self) -> None:
+        """Drop the cached repository status counts."""
+        with self._status_counts_lock:
+            self._status_counts = None
+            self._status_counts_generation += 1
+
+    @staticmethod
+    def _track_repository_changes(session: Session, flush_context) -> None:
+        """Remember whether a flush wrote Repository rows."""
+        if any(
+            isinstance(obj, Repository)
+            for obj in (*session.new, *session.dirty, *session.deleted)
+        ):
+            session.info["repositories_changed"] = True
+
+    def _on_commit(self, session: Session) -> None:
+        """Invalidate cached status counts if the commit changed repositories."""
+        if session.info.pop("repositories_changed", False):
+            self.invalidate_sync_status_counts()
+
+    @staticmethod
+    def _on_rollback(session: Session, previous_transaction) -> None:
+        """Forget repository changes that were rolled back."""
+        session.info.pop("repositories_changed", None)
+
 
 # Global database instance
 _db_instance: Optional[Database] = None
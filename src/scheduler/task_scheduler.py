@@ -7,6 +7,7 @@ Uses APScheduler to manage periodic sync tasks.
 import asyncio
 from typing import Any, Dict, Optional
 
+from apscheduler.jobstores.base import JobLookupError
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
@@ -53,6 +54,10 @@ class TaskScheduler:
 
         self.is_running = False
 
+        # Bumped whenever the set or state of jobs changes, so callers can
+        # cheaply tell whether a cached job listing is still current
+        self.jobs_version = 0
+
     def start(self) -> None:
         """Start the scheduler."""
         if self.is_running:
@@ -62,6 +67,7 @@ class TaskScheduler:
         try:
             self.scheduler.start()
             self.is_running = True
+            self.jobs_version += 1
             self.logger.info("Task scheduler started")
         except Exception as e:
             self.logger.error(f"Failed to start scheduler: {e}")
@@ -76,6 +82,7 @@ class TaskScheduler:
         try:
             self.scheduler.shutdown()
             self.is_running = False
+            self.jobs_version += 1
             self.logger.info("Task scheduler stopped")
         except Exception as e:
             self.logger.error(f"Failed to stop scheduler: {e}")
@@ -117,6 +124,7 @@ class TaskScheduler:
                 name="Repository Synchronization",
                 replace_existing=True
             )
+            self.jobs_version += 1
 
             self.logger.info(f"Sync job scheduled: {job_id}")
             return job.id
@@ -160,6 +168,7 @@ class TaskScheduler:
                 name=f"Repository Sync: {repo_name}",
                 replace_existing=True
             )
+            self.jobs_version += 1
 
             self.logger.info(
                 f"Repository sync scheduled: {repo_name} (every {interval_seconds}s)"
@@ -183,6 +192,7 @@ class TaskScheduler:
             job = self.scheduler.get_job(job_id)
             if job:
                 self.scheduler.remove_job(job_id)
+                self.jobs_version += 1
                 self.logger.info(f"Job removed: {job_id}")
                 return True
             else:
@@ -304,16 +314,17 @@ class TaskScheduler:
             True if successful
         """
         try:
-            job = self.scheduler.get_job(job_id)
-            if job:
-                self.scheduler.pause_job(job_id)
-                self.logger.info(f"Job paused: {job_id}")
-                return True
+            self.scheduler.pause_job(job_id)
+        except JobLookupError:
             return False
         except Exception as e:
             self.logger.error(f"Failed to pause job: {e}")
             return False
 
+        self.jobs_version += 1
+        self.logger.info(f"Job paused: {job_id}")
+        return True
+
     def resume_job(self, job_id: str) -> bool:
         """Resume a paused job.
 
@@ -324,16 +335,17 @@ class TaskScheduler:
             True if successful
         """
         try:
-            job = self.scheduler.get_job(job_id)
-            if job:
-                self.scheduler.resume_job(job_id)
-                self.logger.info(f"Job resumed: {job_id}")
-                return True
+            self.scheduler.resume_job(job_id)
+        except JobLookupError:
             return False
         except Exception as e:
             self.logger.error(f"Failed to resume job: {e}")
             return False
 
+        self.jobs_version += 1
+        self.logger.info(f"Job resumed: {job_id}")
+        return True
+
     def close(self) -> None:
         """Close the scheduler and cleanup."""
         try:
@@ -4,12 +4,19 @@ Synchronization engine for mirroring GitHub repositories to Gitea.
 Handles cloning, pulling, and pushing repository updates.
 """
 
+import functools
+import hashlib
 import os
+import re
+import shutil
 import subprocess
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Tuple
 
 from git import Repo, GitCommandError
 from sqlalchemy.orm import Session
@@ -21,6 +28,74 @@ from ..logger.logger import get_logger
 from ..models import Database, Repository, SyncHistory
 
 
+def _keyword_pattern(keywords: Iterable[str]) -> Pattern[str]:
+    """Compile a pattern matching any of the given literal keywords.
+
+    Args:
+        keywords: Substrings to look for (matched case-sensitively)
+
+    Returns:
+        Compiled regular expression
+    """
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+# History rows are written with a plain INSERT; nothing reads them back
+_HISTORY_INSERT = SyncHistory.__table__.insert()
+
+# Error messages worth retrying, per operation and exception type
+_CLONE_GIT_RETRY_RE = _keyword_pattern([
+    "HTTP2 framing layer",
+    "Connection timed out",
+    "Temporary failure",
+    "Network is unreachable",
+    "No address associated",
+    "Connection reset by peer",
+    "timeout",
+    "RPC failed",
+    "curl 18",
+    "Transferred a partial file",
+    "early EOF",
+    "fetch-pack",
+    "unexpected disconnect",
+    "index-pack"
+])
+_CLONE_RETRY_RE = _keyword_pattern([
+    "timeout",
+    "temporary",
+    "reset",
+    "connection",
+    "network",
+    "RPC failed",
+    "partial file"
+])
+_FETCH_RETRY_RE = _keyword_pattern([
+    "HTTP2 framing layer",
+    "Connection timed out",
+    "timeout",
+    "reset",
+    "Temporary",
+    "refusing to fetch",  # Branch checkout conflict
+    "remote unpack failed"  # Network/remote issues
+])
+_UPDATE_GIT_RETRY_RE = _keyword_pattern([
+    "HTTP2 framing layer",
+    "Connection timed out",
+    "timeout",
+    "reset",
+    "Temporary failure",
+    "Network",
+    "refusing to fetch",
+    "remote unpack failed"
+])
+_UPDATE_RETRY_RE = _keyword_pattern([
+    "timeout",
+    "connection",
+    "reset",
+    "temporary"
+])
+
+
 class SyncEngine:
     """Engine for synchronizing GitHub repositories to Gitea."""
 
@@ -50,13 +125,27 @@ class SyncEngine:
         self.proxy_config = proxy_config
         self.logger = get_logger("sync_engine", log_config)
 
-        self.github_client = GitHubClient(github_config, log_config, proxy_config)
+        self.github_client = GitHubClient(
+            github_config, log_config, proxy_config, shared_session=True
+        )
         self.gitea_client = GiteaClient(gitea_config, log_config, proxy_config)
 
         # Create local repo path
         self.local_repo_path = Path(sync_config.local_path)
         self.local_repo_path.mkdir(parents=True, exist_ok=True)
 
+        # Bare mirrors that new clones borrow objects from (if enabled). They
+        # live next to the repository directory so no repository name can
+        # collide with them
+        repos_root = self.local_repo_path.resolve()
+        self.clone_cache_path = repos_root.parent / f"{repos_root.name}-cache"
+        self._clone_cache_locks: Dict[Path, threading.Lock] = {}
+        self._clone_cache_locks_guard = threading.Lock()
+
+        # Concurrent syncs write their results one at a time: SQLite allows a
+        # single writer, and an in-memory database shares one connection
+        self._db_write_lock = threading.Lock()
+
     def _get_git_env(self) -> Dict[str, str]:
         """Build Git environment variables with proxy configuration.
 
@@ -118,63 +207,28 @@ class SyncEngine:
             # Get or extract repository owner and name from GitHub URL
             github_owner, github_repo_name = self._extract_owner_and_repo(github_url)
 
-            # Check if repository exists in Gitea, create if not
-            repo_exists = False
-            if gitea_org:
-                repo_exists = self.gitea_client.repository_exists(gitea_org, repo_name)
-            else:
-                repo_exists = self.gitea_client.repository_exists(gitea_owner, repo_name)
-
-            if not repo_exists:
-                self.logger.info(
-                    f"Repository does not exist in Gitea, creating: {gitea_org or gitea_owner}/{repo_name}"
+            # Prepare the Gitea repository while the local clone is updated;
+            # the two talk to different servers
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="gitea") as pool:
+                gitea_ready = pool.submit(
+                    self._ensure_gitea_repository, repo_name, github_url, gitea_owner, gitea_org
                 )
-                try:
-                    self.gitea_client.create_repository(
-                        name=repo_name,
-                        description=f"Mirror of {github_url}",
-                        private=False,
-                        org=gitea_org
-                    )
-                except PermissionError as e:
-                    # If org creation fails due to permissions, try user namespace
-                    if gitea_org:
-                        self.logger.warning(
-                            f"Failed to create in organization {gitea_org}, trying user namespace: {e}"
-                        )
-                        try:
-                            self.gitea_client.create_repository(
-                                name=repo_name,
-                                description=f"Mirror of {github_url}",
-                                private=False,
-                                org=None
-                            )
-                            self.logger.info(
-                                f"Repository created in user namespace (fallback from org {gitea_org})"
-                            )
-                        except PermissionError as fallback_error:
-                            error_msg = (
-                                f"Failed to create repository in both organization '{gitea_org}' "
-                                f"and user namespace. Token permissions issue: {fallback_error}. "
-                                f"See GITEA_TOKEN_PERMISSIONS.md for required permissions."
-                            )
-                            self.logger.error(error_msg)
-                            raise Exception(error_msg)
-                    else:
-                        raise
 
-            # Get local repository path
-            local_path = self.local_repo_path / repo_name
+                # Get local repository path
+                local_path = self.local_repo_path / repo_name
 
-            # Clone or update repository
-            if local_path.exists():
-                self.logger.debug(f"Repository exists locally, updating: {repo_name}")
-                status, log_output = self._update_repository(local_path, github_url)
-                operation_type = "update"
-            else:
-                self.logger.debug(f"Cloning repository: {repo_name}")
-                status, log_output = self._clone_repository(github_url, local_path)
-                operation_type = "clone"
+                # Clone or update repository
+                if local_path.exists():
+                    self.logger.debug(f"Repository exists locally, updating: {repo_name}")
+                    status, log_output = self._update_repository(local_path, github_url)
+                    operation_type = "update"
+                else:
+                    self.logger.debug(f"Cloning repository: {repo_name}")
+                    status, log_output = self._clone_repository(github_url, local_path)
+                    operation_type = "clone"
+
+                # Gitea errors take precedence, as when the steps ran in sequence
+                gitea_ready.result()
 
             if status != "success":
                 raise Exception(f"Failed to {operation_type} repository: {log_output}")
@@ -203,15 +257,18 @@ class SyncEngine:
                 "message": f"Successfully synchronized {repo_name}"
             }
 
-            # Record sync history
-            self._record_sync_history(
-                session, repo_name, operation_type, "success", duration
-            )
+            with self._db_write_lock:
+                # Record sync history
+                self._record_sync_history(
+                    session, repo_name, operation_type, "success", duration
+                )
 
-            # Update repository status in database
-            self._update_repository_status(
-                session, repo_name, github_url, "success", end_time, None, gitea_org, local_path
-            )
+                # Update repository status in database
+                self._update_repository_status(
+                    session, repo_name, github_url, "success", end_time, None, gitea_org, local_path
+                )
+                # End the session's transaction before another sync writes
+                session.close()
 
             self.logger.info(f"Successfully synchronized repository: {repo_name}")
             return result
@@ -223,15 +280,17 @@ class SyncEngine:
             error_message = str(e)
             self.logger.error(f"Failed to synchronize repository {repo_name}: {error_message}")
 
-            # Record failed sync
-            self._record_sync_history(
-                session, repo_name, "sync", "failed", duration, error_message
-            )
+            with self._db_write_lock:
+                # Record failed sync
+                self._record_sync_history(
+                    session, repo_name, "sync", "failed", duration, error_message
+                )
 
-            # Update repository status in database
-            self._update_repository_status(
-                session, repo_name, github_url, "failed", end_time, error_message, gitea_org, local_path if 'local_path' in locals() else None
-            )
+                # Update repository status in database
+                self._update_repository_status(
+                    session, repo_name, github_url, "failed", end_time, error_message, gitea_org, local_path if 'local_path' in locals() else None
+                )
+                session.close()
 
             return {
                 "status": "failed",
@@ -243,6 +302,69 @@ class SyncEngine:
         finally:
             session.close()
 
+    def _ensure_gitea_repository(
+        self,
+        repo_name: str,
+        github_url: str,
+        gitea_owner: str,
+        gitea_org: str = None
+    ) -> None:
+        """Create the Gitea repository if it does not exist yet.
+
+        Args:
+            repo_name: Repository name
+            github_url: Normalized GitHub repository URL
+            gitea_owner: Gitea owner username
+            gitea_org: Optional Gitea organization to create repo in
+
+        Raises:
+            Exception: If the repository cannot be created
+        """
+        # Check if repository exists in Gitea, create if not
+        repo_exists = False
+        if gitea_org:
+            repo_exists = self.gitea_client.repository_exists(gitea_org, repo_name)
+        else:
+            repo_exists = self.gitea_client.repository_exists(gitea_owner, repo_name)
+
+        if not repo_exists:
+            self.logger.info(
+                f"Repository does not exist in Gitea, creating: {gitea_org or gitea_owner}/{repo_name}"
+            )
+            try:
+                self.gitea_client.create_repository(
+                    name=repo_name,
+                    description=f"Mirror of {github_url}",
+                    private=False,
+                    org=gitea_org
+                )
+            except PermissionError as e:
+                # If org creation fails due to permissions, try user namespace
+                if gitea_org:
+                    self.logger.warning(
+                        f"Failed to create in organization {gitea_org}, trying user namespace: {e}"
+                    )
+                    try:
+                        self.gitea_client.create_repository(
+                            name=repo_name,
+                            description=f"Mirror of {github_url}",
+                            private=False,
+                            org=None
+                        )
+                        self.logger.info(
+                            f"Repository created in user namespace (fallback from org {gitea_org})"
+                        )
+                    except PermissionError as fallback_error:
+                        error_msg = (
+                            f"Failed to create repository in both organization '{gitea_org}' "
+                            f"and user namespace. Token permissions issue: {fallback_error}. "
+                            f"See GITEA_TOKEN_PERMISSIONS.md for required permissions."
+                        )
+                        self.logger.error(error_msg)
+                        raise Exception(error_msg)
+                else:
+                    raise
+
     def _clone_repository(
         self,
         github_url: str,
@@ -261,27 +383,32 @@ class SyncEngine:
         """
         last_error = None
 
+        # Borrow objects from the cached mirror; --dissociate copies them so
+        # the clone does not depend on the cache afterwards
+        clone_options = {}
+        if self.sync_config.clone_cache:
+            cache_path = self._refresh_clone_cache(github_url)
+            if cache_path is not None:
+                clone_options = {"reference_if_able": str(cache_path), "dissociate": True}
+
+        multi_options = self._get_clone_config_options()
+        if self.sync_config.shallow_mirror:
+            # Latest commit of every branch, not just the default one
+            multi_options += ["--depth=1", "--no-single-branch"]
+
         for attempt in range(max_retries):
             try:
                 self.logger.debug(f"Cloning from {github_url} to {local_path} (attempt {attempt + 1}/{max_retries})")
 
-                # Configure git for better HTTP/2 handling and proxy support
-                # Use multi_options to set git config options
-                git_config_options = [
-                    '-c', 'http.version=HTTP/1.1',  # Force HTTP/1.1
-                    '-c', f'http.postBuffer={500 * 1024 * 1024}',  # 500MB buffer
-                    '-c', 'http.lowSpeedLimit=1000',  # 1KB/s minimum
-                    '-c', 'http.lowSpeedTime=60',  # for 60 seconds
-                ]
-
                 repo = Repo.clone_from(
                     github_url,
                     local_path,
                     mirror=False,
                     depth=None,
                     env=self._get_git_env(),
-                    multi_options=git_config_options,
-                    allow_unsafe_options=True  # Allow -c git config options
+                    multi_options=multi_options,
+                    allow_unsafe_options=True,  # Allow -c git config options
+                    **clone_options
                 )
 
                 self.logger.debug(f"Successfully cloned repository to {local_path}")
@@ -292,22 +419,7 @@ class SyncEngine:
                 last_error = error_msg
 
                 # Check if it's a transient error (HTTP/2 framing layer, timeout, RPC failed, etc)
-                if any(x in error_msg for x in [
-                    "HTTP2 framing layer",
-                    "Connection timed out",
-                    "Temporary failure",
-                    "Network is unreachable",
-                    "No address associated",
-                    "Connection reset by peer",
-                    "timeout",
-                    "RPC failed",
-                    "curl 18",
-                    "Transferred a partial file",
-                    "early EOF",
-                    "fetch-pack",
-                    "unexpected disconnect",
-                    "index-pack"
-                ]):
+                if _CLONE_GIT_RETRY_RE.search(error_msg):
                     if attempt < max_retries - 1:
                         # Clean up partial clone before retry
                         if local_path.exists():
@@ -335,15 +447,7 @@ class SyncEngine:
                 last_error = error_msg
 
                 # Check for transient network errors
-                if any(x in error_msg for x in [
-                    "timeout",
-                    "temporary",
-                    "reset",
-                    "connection",
-                    "network",
-                    "RPC failed",
-                    "partial file"
-                ]):
+                if _CLONE_RETRY_RE.search(error_msg):
                     if attempt < max_retries - 1:
                         # Clean up partial clone before retry
                         if local_path.exists():
@@ -370,6 +474,77 @@ class SyncEngine:
         self.logger.error(full_error)
         return "failed", full_error
 
+    @staticmethod
+    def _get_clone_config_options() -> list:
+        """Build git config options passed to clone commands.
+
+        Returns:
+            List of ``-c key=value`` arguments
+        """
+        # Configure git for better HTTP/2 handling and proxy support
+        return [
+            '-c', 'http.version=HTTP/1.1',  # Force HTTP/1.1
+            '-c', f'http.postBuffer={500 * 1024 * 1024}',  # 500MB buffer
+            '-c', 'http.lowSpeedLimit=1000',  # 1KB/s minimum
+            '-c', 'http.lowSpeedTime=60',  # for 60 seconds
+        ]
+
+    def _refresh_clone_cache(self, github_url: str) -> Optional[Path]:
+        """Create or update the cached bare mirror of a GitHub repository.
+
+        Args:
+            github_url: Normalized GitHub repository URL
+
+        Returns:
+            Path of the cached mirror, or None if it could not be prepared
+        """
+        cache_key = hashlib.sha1(github_url.encode("utf-8")).hexdigest()
+        cache_path = self.clone_cache_path / cache_key
+
+        # Repositories with different names may share a URL and run at the
+        # same time; only one of them may write the mirror
+        with self._clone_cache_locks_guard:
+            lock = self._clone_cache_locks.setdefault(cache_path, threading.Lock())
+
+        with lock:
+            try:
+                if cache_path.exists():
+                    self.logger.debug(f"Updating clone cache for {github_url}")
+                    Repo(cache_path).remotes.origin.fetch(prune=True, env=self._get_git_env())
+                else:
+                    self.logger.debug(f"Creating clone cache for {github_url} at {cache_path}")
+                    self._create_clone_cache(github_url, cache_path)
+                return cache_path
+            except Exception as e:
+                self.logger.warning(f"Clone cache unavailable for {github_url}, cloning directly: {e}")
+                return None
+
+    def _create_clone_cache(self, github_url: str, cache_path: Path) -> None:
+        """Clone a bare mirror into a temporary directory and move it into place.
+
+        A failed clone leaves nothing at cache_path, so a half-written mirror
+        is never reused.
+
+        Args:
+            github_url: Normalized GitHub repository URL
+            cache_path: Final path of the cached mirror
+        """
+        self.clone_cache_path.mkdir(parents=True, exist_ok=True)
+        tmp_path = Path(tempfile.mkdtemp(prefix=f".{cache_path.name}-", dir=self.clone_cache_path))
+        try:
+            Repo.clone_from(
+                github_url,
+                tmp_path,
+                mirror=True,
+                env=self._get_git_env(),
+                multi_options=self._get_clone_config_options(),
+                allow_unsafe_options=True
+            )
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            raise
+
     def _update_repository(
         self,
         local_path: Path,
@@ -422,15 +597,7 @@ class SyncEngine:
                 except GitCommandError as fetch_error:
                     # Retry fetch on transient errors and recoverable errors
                     error_str = str(fetch_error)
-                    if any(x in error_str for x in [
-                        "HTTP2 framing layer",
-                        "Connection timed out",
-                        "timeout",
-                        "reset",
-                        "Temporary",
-                        "refusing to fetch",  # Branch checkout conflict
-                        "remote unpack failed"  # Network/remote issues
-                    ]) and attempt < max_retries - 1:
+                    if _FETCH_RETRY_RE.search(error_str) and attempt < max_retries - 1:
                         wait_time = 5 * (attempt + 1)
                         self.logger.warning(
                             f"Transient fetch error, retrying in {wait_time}s: {fetch_error}"
@@ -447,16 +614,7 @@ class SyncEngine:
                 last_error = error_msg
 
                 # Check if it's a transient or recoverable error
-                if any(x in error_msg for x in [
-                    "HTTP2 framing layer",
-                    "Connection timed out",
-                    "timeout",
-                    "reset",
-                    "Temporary failure",
-                    "Network",
-                    "refusing to fetch",
-                    "remote unpack failed"
-                ]) and attempt < max_retries - 1:
+                if _UPDATE_GIT_RETRY_RE.search(error_msg) and attempt < max_retries - 1:
                     wait_time = 5 * (attempt + 1)
                     self.logger.warning(
                         f"Transient network error, retrying in {wait_time}s: {error_msg}"
@@ -472,12 +630,7 @@ class SyncEngine:
                 error_msg = str(e)
                 last_error = error_msg
 
-                if any(x in error_msg for x in [
-                    "timeout",
-                    "connection",
-                    "reset",
-                    "temporary"
-                ]) and attempt < max_retries - 1:
+                if _UPDATE_RETRY_RE.search(error_msg) and attempt < max_retries - 1:
                     wait_time = 5 * (attempt + 1)
                     self.logger.warning(
                         f"Network error, retrying in {wait_time}s: {error_msg}"
@@ -648,6 +801,13 @@ class SyncEngine:
                     elif "413" in error_output or "Entity Too Large" in error_output:
                         self.logger.warning("[PUSH] HTTP 413 error - attempting fallback strategy")
                         return self._push_to_gitea_individually(repo, gitea_owner, repo_name, timeout)
+                    elif "shallow update not allowed" in (result.stdout or error_output):
+                        # --porcelain reports per-ref rejections on stdout
+                        raise GitCommandError(
+                            f"Gitea rejected the shallow push to {gitea_owner}/{repo_name}. "
+                            f"Allow shallow updates on the Gitea side or disable SYNC_SHALLOW_MIRROR.",
+                            result.returncode
+                        )
                     elif "timeout" in error_output.lower() or "timed out" in error_output.lower():
                         raise GitCommandError(
                             f"Push timed out after {push_duration:.1f}s. "
@@ -793,6 +953,9 @@ class SyncEngine:
     def sync_all(self, repositories: list = None) -> Dict[str, Any]:
         """Synchronize all repositories.
 
+        Up to ``sync_config.concurrent_tasks`` repositories are synced at
+        the same time.
+
         Args:
             repositories: Optional list of repositories to sync
 
@@ -819,39 +982,72 @@ class SyncEngine:
             "repositories": []
         }
 
-        for repo in repositories:
-            try:
-                # If gitea_owner is set in repo, treat it as organization
-                # Otherwise, push to user namespace
-                gitea_org_name = repo.get("gitea_owner")
-
-                result = self.sync_repository(
-                    repo["name"],
-                    repo["url"],
-                    gitea_owner=self.gitea_config.username if gitea_org_name else None,
-                    gitea_org=gitea_org_name
-                )
-                results["repositories"].append(result)
-
-                if result["status"] == "success":
-                    results["success"] += 1
-                else:
-                    results["failed"] += 1
-
-            except Exception as e:
-                self.logger.error(f"Error syncing {repo.get('name')}: {e}")
+        # Repositories with the same name share a local clone, so each group
+        # is synced sequentially by a single worker
+        groups: Dict[Any, List[Tuple[int, dict]]] = {}
+        for index, repo in enumerate(repositories):
+            groups.setdefault(repo.get("name"), []).append((index, repo))
+
+        repo_results: List[Optional[Dict[str, Any]]] = [None] * len(repositories)
+        max_workers = max(1, min(self.sync_config.concurrent_tasks, len(groups)))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sync") as pool:
+            futures = [pool.submit(self._sync_group, group) for group in groups.values()]
+            for future in futures:
+                for index, result in future.result():
+                    repo_results[index] = result
+
+        for result in repo_results:
+            results["repositories"].append(result)
+            if result["status"] == "success":
+                results["success"] += 1
+            else:
                 results["failed"] += 1
-                results["repositories"].append({
-                    "status": "failed",
-                    "repository": repo.get("name"),
-                    "error": str(e)
-                })
 
         self.logger.info(
             f"Sync complete: {results['success']} success, {results['failed']} failed"
         )
         return results
 
+    def _sync_group(self, group: List[Tuple[int, dict]]) -> List[Tuple[int, Dict[str, Any]]]:
+        """Synchronize repositories that share a local clone, one after another.
+
+        Args:
+            group: (position, repository) pairs in sync_all input order
+
+        Returns:
+            (position, sync result) pairs
+        """
+        return [(index, self._sync_entry(repo)) for index, repo in group]
+
+    def _sync_entry(self, repo: dict) -> Dict[str, Any]:
+        """Synchronize one repository entry of sync_all.
+
+        Args:
+            repo: Repository dictionary (name, url and optional gitea_owner)
+
+        Returns:
+            Sync result dictionary; errors are reported as a failed result
+        """
+        try:
+            # If gitea_owner is set in repo, treat it as organization
+            # Otherwise, push to user namespace
+            gitea_org_name = repo.get("gitea_owner")
+
+            return self.sync_repository(
+                repo["name"],
+                repo["url"],
+                gitea_owner=self.gitea_config.username if gitea_org_name else None,
+                gitea_org=gitea_org_name
+            )
+
+        except Exception as e:
+            self.logger.error(f"Error syncing {repo.get('name')}: {e}")
+            return {
+                "status": "failed",
+                "repository": repo.get("name"),
+                "error": str(e)
+            }
+
     def _record_sync_history(
         self,
         session: Session,
@@ -872,16 +1068,15 @@ class SyncEngine:
             error_message: Error message if failed
         """
         try:
-            history = SyncHistory(
-                repository_id=0,  # Will be updated if repo exists
-                repository_name=repo_name,
-                operation_type=operation_type,
-                status=status,
-                error_message=error_message,
-                start_time=datetime.utcnow(),
-                duration_seconds=duration_seconds
-            )
-            session.add(history)
+            session.execute(_HISTORY_INSERT, {
+                "repository_id": 0,  # Will be updated if repo exists
+                "repository_name": repo_name,
+                "operation_type": operation_type,
+                "status": status,
+                "error_message": error_message,
+                "start_time": datetime.utcnow(),
+                "duration_seconds": duration_seconds
+            })
             session.commit()
         except Exception as e:
             self.logger.error(f"Failed to record sync history: {e}")
@@ -961,15 +1156,26 @@ class SyncEngine:
         """
         try:
             total_size = 0
-            for dirpath, dirnames, filenames in os.walk(directory):
-                for filename in filenames:
-                    filepath = os.path.join(dirpath, filename)
-                    try:
-                        if os.path.exists(filepath):
-                            total_size += os.path.getsize(filepath)
-                    except OSError:
-                        # Skip files that can't be accessed
-                        pass
+            pending = [directory]
+            while pending:
+                try:
+                    entries = os.scandir(pending.pop())
+                except OSError:
+                    # Skip directories that can't be listed
+                    continue
+
+                with entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir():
+                                # Like os.walk, don't descend into symlinked directories
+                                if not entry.is_symlink():
+                                    pending.append(entry.path)
+                            else:
+                                total_size += entry.stat().st_size
+                        except OSError:
+                            # Skip files that can't be accessed (e.g. broken symlinks)
+                            pass
 
             # Convert bytes to MB
             size_mb = total_size / (1024 * 1024)
@@ -980,6 +1186,7 @@ class SyncEngine:
 
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _normalize_github_url(github_url: str) -> str:
         """Normalize GitHub URL to ensure it ends with .git.
 
@@ -1006,6 +1213,7 @@ class SyncEngine:
         return github_url
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _extract_owner_and_repo(github_url: str) -> Tuple[str, str]:
         """Extract owner and repo name from GitHub URL.
 
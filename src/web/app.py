@@ -6,9 +6,10 @@ Main entry point for the web application.
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
-from fastapi import FastAPI, HTTPException, Request
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
@@ -18,6 +19,7 @@ from ..config.config import load_config
 from ..logger.logger import init_default_logger
 from ..models import init_database
 from .. import __version__
+from .dependencies import get_config, get_db, get_scheduler, set_app_state
 
 # Get project root
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -25,11 +27,20 @@ WEB_ROOT = PROJECT_ROOT / "src" / "web"
 STATIC_DIR = WEB_ROOT / "static"
 TEMPLATES_DIR = WEB_ROOT / "templates"
 
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 # Create FastAPI app
 app = FastAPI(
     title="GitHub Mirror Sync",
     description="Web UI for GitHub to Gitea repository synchronization",
-    version=__version__
+    version=__version__,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -56,38 +67,23 @@ if TEMPLATES_DIR.exists():
         # jinja2 not installed, use fallback HTML
         templates = None
 
-# Global state
-_config = None
-_db = None
-_scheduler = None
-
-
-def get_app_state():
-    """Get application state."""
-    return {
-        "config": _config,
-        "db": _db,
-        "scheduler": _scheduler
-    }
-
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize application on startup."""
-    global _config, _db, _scheduler
-
     try:
         # Load configuration
         env_file = os.getenv("CONFIG_FILE", ".env")
-        _config = load_config(env_file)
+        config = load_config(env_file)
+        set_app_state(config=config)
         print(f"✓ Configuration loaded")
 
         # Initialize logging
-        init_default_logger(_config.log)
-        print(f"✓ Logging initialized (level: {_config.log.level})")
+        init_default_logger(config.log)
+        print(f"✓ Logging initialized (level: {config.log.level})")
 
         # Create log directory if needed
-        log_dir = Path(_config.log.file_path).parent
+        log_dir = Path(config.log.file_path).parent
         log_dir.mkdir(parents=True, exist_ok=True)
 
         # Initialize database
@@ -143,7 +139,8 @@ async def startup_event():
             print(f"✓ SQLite database directory created: {db_dir}")
 
         try:
-            _db = init_database(db_url)
+            db = init_database(db_url)
+            set_app_state(db=db)
             print(f"✓ Database initialized successfully")
         except Exception as db_error:
             error_msg = str(db_error)
@@ -193,40 +190,41 @@ async def startup_event():
             ) from db_error
 
         # Create local repository storage directory
-        local_repo_dir = Path(_config.sync.local_path)
+        local_repo_dir = Path(config.sync.local_path)
         local_repo_dir.mkdir(parents=True, exist_ok=True)
-        print(f"✓ Local repository storage: {_config.sync.local_path}")
+        print(f"✓ Local repository storage: {config.sync.local_path}")
 
         # Initialize scheduler
         from ..scheduler.task_scheduler import TaskScheduler
-        _scheduler = TaskScheduler(
-            _config.github,
-            _config.gitea,
-            _config.sync,
-            _db,
-            _config.log,
-            _config.proxy
+        scheduler = TaskScheduler(
+            config.github,
+            config.gitea,
+            config.sync,
+            db,
+            config.log,
+            config.proxy
         )
+        set_app_state(scheduler=scheduler)
         print("✓ Task scheduler initialized")
 
         # Start the scheduler
-        _scheduler.start()
+        scheduler.start()
         print("✓ Task scheduler started")
 
         # Schedule automatic sync task
-        sync_interval = _config.sync.interval if _config.sync.interval else 3600
+        sync_interval = config.sync.interval if config.sync.interval else 3600
         try:
-            job_id = _scheduler.schedule_sync(interval_seconds=sync_interval)
+            job_id = scheduler.schedule_sync(interval_seconds=sync_interval)
             print(f"✓ Scheduled automatic sync every {sync_interval} seconds (job_id: {job_id})")
         except Exception as e:
             print(f"⚠ Could not schedule automatic sync: {e}")
             print(f"  You can manually schedule sync via API: POST /api/tasks/sync/schedule")
 
         # Validate configurations
-        if _config.github:
-            print(f"✓ GitHub API: {_config.github.api_url}")
-        if _config.gitea:
-            print(f"✓ Gitea Server: {_config.gitea.url}")
+        if config.github:
+            print(f"✓ GitHub API: {config.github.api_url}")
+        if config.gitea:
+            print(f"✓ Gitea Server: {config.gitea.url}")
 
         print("\n🚀 GitHub Mirror Sync Web UI Started")
         print(f"   Access at: http://localhost:8000")
@@ -241,12 +239,15 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown."""
-    global _scheduler
+    scheduler = get_scheduler()
 
     try:
-        if _scheduler:
-            _scheduler.close()
+        if scheduler:
+            scheduler.close()
             print("✓ Scheduler closed")
+
+        from ..clients.github_client import GitHubClient
+        GitHubClient.shutdown_all()
     except Exception as e:
         print(f"✗ Shutdown error: {e}")
 
@@ -303,18 +304,15 @@ async def health_check():
 
 
 @app.get("/api/config/status")
-async def config_status():
+async def config_status(config=Depends(get_config), db=Depends(get_db)):
     """Get configuration status."""
-    state = get_app_state()
-    config = state["config"]
-
     if not config:
         raise HTTPException(status_code=503, detail="Configuration not loaded")
 
     return {
         "github_configured": bool(config.github),
         "gitea_configured": bool(config.gitea),
-        "database_configured": bool(state["db"]),
+        "database_configured": bool(db),
         "sync_enabled": True
     }
 
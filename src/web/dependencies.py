@@ -0,0 +1,39 @@
+"""
+FastAPI dependencies for the Web UI.
+
+Holds the application state populated on startup and exposes each component
+to the route handlers through ``Depends``.
+"""
+
+from typing import Any, Dict
+
+# Application state, populated once by the startup event
+_state: Dict[str, Any] = {
+    "config": None,
+    "db": None,
+    "scheduler": None
+}
+
+
+def set_app_state(**components: Any) -> None:
+    """Update application state components.
+
+    Args:
+        **components: Components to store (config, db, scheduler)
+    """
+    _state.update(components)
+
+
+def get_config():
+    """Get the loaded system configuration (None until startup)."""
+    return _state["config"]
+
+
+def get_db():
+    """Get the database instance (None until startup)."""
+    return _state["db"]
+
+
+def get_scheduler():
+    """Get the task scheduler (None until startup)."""
+    return _state["scheduler"]
@@ -4,9 +4,11 @@ Configuration management API routes.
 
 from typing import Any, Dict, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
+from ..dependencies import get_config as get_app_config
+
 router = APIRouter()
 
 
@@ -24,13 +26,8 @@ class ConfigResponse(BaseModel):
 
 
 @router.get("/", response_model=ConfigResponse)
-async def get_config():
+async def get_config(config=Depends(get_app_config)):
     """Get current configuration."""
-    from ..app import get_app_state
-
-    state = get_app_state()
-    config = state.get("config")
-
     if not config:
         raise HTTPException(status_code=503, detail="Configuration not loaded")
 
@@ -56,14 +53,10 @@ async def get_config():
 
 
 @router.post("/validate/github")
-async def validate_github_config(token: str):
+async def validate_github_config(token: str, config=Depends(get_app_config)):
     """Validate GitHub token."""
     from ...clients.github_client import GitHubClient
     from ...config.config import GitHubConfig
-    from ..app import get_app_state
-
-    state = get_app_state()
-    config = state.get("config")
 
     if not config:
         raise HTTPException(status_code=503, detail="Configuration not loaded")
@@ -86,14 +79,10 @@ async def validate_github_config(token: str):
 
 
 @router.post("/validate/gitea")
-async def validate_gitea_config(url: str, token: str):
+async def validate_gitea_config(url: str, token: str, config=Depends(get_app_config)):
     """Validate Gitea connection."""
     from ...clients.gitea_client import GiteaClient
     from ...config.config import GiteaConfig
-    from ..app import get_app_state
-
-    state = get_app_state()
-    config = state.get("config")
 
     if not config:
         raise HTTPException(status_code=503, detail="Configuration not loaded")
@@ -119,13 +108,10 @@ async def validate_gitea_config(url: str, token: str):
 
 
 @router.put("/")
-async def update_config(config_update: ConfigUpdate):
+async def update_config(config_update: ConfigUpdate, config=Depends(get_app_config)):
     """Update configuration."""
-    from ..app import get_app_state
     from ...logger.logger import get_logger
 
-    state = get_app_state()
-    config = state.get("config")
     logger = get_logger("config_router")
 
     if not config:
@@ -155,21 +141,17 @@ async def update_config(config_update: ConfigUpdate):
 
 
 @router.get("/status")
-async def get_config_status():
+async def get_config_status(config=Depends(get_app_config)):
     """Get configuration status."""
-    from ..app import get_app_state
     from ...clients.github_client import GitHubClient
     from ...clients.gitea_client import GiteaClient
 
-    state = get_app_state()
-    config = state.get("config")
-
     if not config:
         raise HTTPException(status_code=503, detail="Configuration not loaded")
 
     try:
         # Check GitHub
-        github_client = GitHubClient(config.github)
+        github_client = GitHubClient(config.github, shared_session=True)
         github_ok = github_client.validate_token()
         github_client.close()
 
@@ -4,20 +4,18 @@ Monitoring and logging API routes.
 
 from typing import List
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
+
+from ..dependencies import get_db
 
 router = APIRouter()
 
 
 @router.get("/dashboard")
-async def get_dashboard():
+async def get_dashboard(db=Depends(get_db)):
     """Get monitoring dashboard data."""
-    from ..app import get_app_state
     from ...models import Repository, SyncHistory
 
-    state = get_app_state()
-    db = state.get("db")
-
     if not db:
         raise HTTPException(status_code=503, detail="Database not available")
 
@@ -58,14 +56,15 @@ async def get_dashboard():
 
 
 @router.get("/logs")
-async def get_logs(skip: int = 0, limit: int = 100, level: str = "ALL"):
+async def get_logs(
+    skip: int = 0,
+    limit: int = 100,
+    level: str = "ALL",
+    db=Depends(get_db)
+):
     """Get application logs."""
-    from ..app import get_app_state
     from ...models import SyncLog
 
-    state = get_app_state()
-    db = state.get("db")
-
     if not db:
         raise HTTPException(status_code=503, detail="Database not available")
 
@@ -89,16 +88,12 @@ async def get_logs(skip: int = 0, limit: int = 100, level: str = "ALL"):
 
 
 @router.post("/logs/export")
-async def export_logs(format: str = "json"):
+async def export_logs(format: str = "json", db=Depends(get_db)):
     """Export logs to file."""
     from datetime import datetime
-    from ..app import get_app_state
     from ...models import SyncLog
     import json
 
-    state = get_app_state()
-    db = state.get("db")
-
     if not db:
         raise HTTPException(status_code=503, detail="Database not available")
 
@@ -133,14 +128,10 @@ async def export_logs(format: str = "json"):
 
 
 @router.get("/stats")
-async def get_statistics():
+async def get_statistics(db=Depends(get_db)):
     """Get system statistics."""
-    from ..app import get_app_state
     from ...models import Repository, SyncHistory
 
-    state = get_app_state()
-    db = state.get("db")
-
     if not db:
         raise HTTPException(status_code=503, detail="Database not available")
 
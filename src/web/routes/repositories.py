@@ -4,10 +4,12 @@ Repository management API routes.
 
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
+from ..dependencies import get_config, get_db
+
 router = APIRouter()
 
 
@@ -46,14 +48,10 @@ class RepositoryResponse(BaseModel):
 
 
 @router.get("/", response_model=List[RepositoryResponse])
-async def list_repositories(skip: int = 0, limit: int = 100):
+async def list_repositories(skip: int = 0, limit: int = 100, db=Depends(get_db)):
     """List all repositories."""
-    from ..app import get_app_state
     from ...models import Repository
 
-    state = get_app_state()
-    db = state.get("db")
-
     if not db:
         raise HTTPException(status_code=503, detail="Database not available")
 
@@ -69,14 +67,10 @@ async def list_repositories(skip: int = 0, limit: int = 100):
 
 
 @router.get("/{repo_id}", response_model=RepositoryResponse)
-async def get_repository(repo_id: int):
+async def get_repository(repo_id: int, db=Depends(get_db)):
     """Get repository details."""
-    from ..app import get_app_state
     from ...models import Repository
 
-    state = get_app_state()
-    db = state.get("db")
-
     if not db:
         raise HTTPException(status_code=503, detail="Database not available")
 
@@ -94,15 +88,11 @@ async def get_repository(repo_id: int):
 
 
 @router.post("/", response_model=RepositoryResponse)
-async def create_repository(repo: RepositoryCreate):
+async def create_repository(repo: RepositoryCreate, db=Depends(get_db)):
     """Create a new repository."""
-    from ..app import get_app_state
     from ...models import Repository
     from ...sync.sync_engine import SyncEngine
 
-    state = get_app_state()
-    db = state.get("db")
-
     if not db:
         raise HTTPException(status_code=503, detail="Database not available")
 
@@ -144,14 +134,14 @@ async def create_repository(repo: RepositoryCreate):
 
 
 @router.put("/{repo_id}", response_model=RepositoryResponse)
-async def update_repository(repo_id: int, repo_update: RepositoryUpdate):
+async def update_repository(
+    repo_id: int,
+    repo_update: RepositoryUpdate,
+    db=Depends(get_db)
+):
     """Update repository settings."""
-    from ..app import get_app_state
     from ...models import Repository
 
-    state = get_app_state()
-    db = state.get("db")
-
     if not db:
         raise HTTPException(status_code=503, detail="Database not available")
 
@@ -195,7 +185,9 @@ async def delete_repository(
     repo_id: int,
     delete_local: bool = False,
     delete_gitea: bool = False,
-    delete_history: bool = True
+    delete_history: bool = True,
+    db=Depends(get_db),
+    config=Depends(get_config)
 ):
     """
     Delete a repository.
@@ -211,14 +203,9 @@ async def delete_repository(
     """
     import shutil
     from pathlib import Path
-    from ..app import get_app_state
     from ...models import Repository, SyncHistory
     from ...clients.gitea_client import GiteaClient
 
-    state = get_app_state()
-    db = state.get("db")
-    config = state.get("config")
-
     if not db:
         raise HTTPException(status_code=503, detail="Database not available")
 
@@ -303,16 +290,16 @@ async def delete_repository(
 
 
 @router.post("/{repo_id}/sync")
-async def sync_repository(repo_id: int, background_tasks: BackgroundTasks):
+async def sync_repository(
+    repo_id: int,
+    background_tasks: BackgroundTasks,
+    db=Depends(get_db),
+    config=Depends(get_config)
+):
     """Synchronize a specific repository asynchronously in the background."""
-    from ..app import get_app_state
     from ...models import Repository
     from ...sync.sync_engine import SyncEngine
 
-    state = get_app_state()
-    db = state.get("db")
-    config = state.get("config")
-
     if not db or not config:
         raise HTTPException(status_code=503, detail="System not ready")
 
@@ -375,14 +362,10 @@ async def sync_repository(repo_id: int, background_tasks: BackgroundTasks):
 
 
 @router.get("/{repo_id}/history")
-async def get_repository_history(repo_id: int, limit: int = 10):
+async def get_repository_history(repo_id: int, limit: int = 10, db=Depends(get_db)):
     """Get sync history for a repository."""
-    from ..app import get_app_state
     from ...models import SyncHistory
 
-    state = get_app_state()
-    db = state.get("db")
-
     if not db:
         raise HTTPException(status_code=503, detail="Database not available")
 
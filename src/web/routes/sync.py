@@ -2,38 +2,47 @@
 Synchronization control API routes.
 """
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from itertools import chain
+from typing import Iterator
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..dependencies import get_config, get_db
 
 router = APIRouter()
 
+# Number of history rows fetched from the database per batch when streaming
+HISTORY_BATCH_SIZE = 200
+
 
 @router.post("/all")
-async def sync_all_repositories(background_tasks: BackgroundTasks):
+async def sync_all_repositories(
+    background_tasks: BackgroundTasks,
+    db=Depends(get_db),
+    config=Depends(get_config)
+):
     """Synchronize all repositories asynchronously in the background."""
-    from ..app import get_app_state
     from ...sync.sync_engine import SyncEngine
     from ...models import Repository
 
-    state = get_app_state()
-    db = state.get("db")
-    config = state.get("config")
-
     if not db or not config:
         raise HTTPException(status_code=503, detail="System not ready")
 
     try:
         # Get count of repositories to sync
-        session = db.get_session()
-        try:
-            repos = session.query(Repository).filter(Repository.enabled == True).all()
+        with db.session_scope() as session:
+            repos = session.scalars(
+                select(Repository).where(Repository.enabled.is_(True))
+            ).all()
             repo_count = len(repos)
 
             # Update all to syncing status
             for repo in repos:
                 repo.last_sync_status = "syncing"
-            session.commit()
-        finally:
-            session.close()
 
         # Define background task function
         def run_sync_all():
@@ -67,61 +76,75 @@ async def sync_all_repositories(background_tasks: BackgroundTasks):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _iter_history_json(session: Session, first_batch, batches) -> Iterator[bytes]:
+    """Encode history records as a JSON array, one record at a time.
+
+    A database error while reading later batches propagates, so the
+    connection is aborted instead of ending with a truncated array.
+
+    Args:
+        session: Session the records are loaded through (closed when done)
+        first_batch: Records already loaded before the response started
+        batches: Iterator over the remaining batches of SyncHistory records
+    """
+    try:
+        yield b"["
+        records = chain(first_batch, chain.from_iterable(batches))
+        for index, record in enumerate(records):
+            if index:
+                yield b","
+            yield orjson.dumps(record.to_dict())
+        yield b"]"
+    finally:
+        session.close()
+
+
 @router.get("/history")
-async def get_sync_history(skip: int = 0, limit: int = 50):
+async def get_sync_history(skip: int = 0, limit: int = 50, db=Depends(get_db)):
     """Get synchronization history."""
-    from ..app import get_app_state
     from ...models import SyncHistory
 
-    state = get_app_state()
-    db = state.get("db")
-
     if not db:
         raise HTTPException(status_code=503, detail="Database not available")
 
+    session = db.get_session()
     try:
-        session = db.get_session()
-        try:
-            history = session.query(SyncHistory).order_by(
-                SyncHistory.created_at.desc()
-            ).offset(skip).limit(limit).all()
-
-            return [h.to_dict() for h in history]
-        finally:
-            session.close()
+        batches = session.scalars(
+            select(SyncHistory)
+            .order_by(SyncHistory.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+            .execution_options(yield_per=HISTORY_BATCH_SIZE)
+        ).partitions()
+        # Load the first batch up front so an early failure still gets a 500
+        first_batch = next(batches, [])
     except Exception as e:
+        session.close()
         raise HTTPException(status_code=500, detail=str(e))
 
+    return StreamingResponse(
+        _iter_history_json(session, first_batch, batches),
+        media_type="application/json"
+    )
+
 
 @router.get("/status")
-async def get_sync_status():
+async def get_sync_status(db=Depends(get_db)):
     """Get current synchronization status."""
-    from ..app import get_app_state
-    from ...models import Repository
-
-    state = get_app_state()
-    db = state.get("db")
-
     if not db:
         raise HTTPException(status_code=503, detail="Database not available")
 
     try:
-        session = db.get_session()
-        try:
-            repos = session.query(Repository).all()
-            total = len(repos)
-            synced = sum(1 for r in repos if r.last_sync_status == "success")
-            syncing = sum(1 for r in repos if r.last_sync_status == "syncing")
-            failed = sum(1 for r in repos if r.last_sync_status == "failed")
-
-            return {
-                "total_repositories": total,
-                "synced": synced,
-                "syncing": syncing,
-                "failed": failed,
-                "sync_rate": (synced / total * 100) if total > 0 else 0
-            }
-        finally:
-            session.close()
+        counts = db.get_sync_status_counts()
+        total = sum(counts.values())
+        synced = counts.get("success", 0)
+
+        return {
+            "total_repositories": total,
+            "synced": synced,
+            "syncing": counts.get("syncing", 0),
+            "failed": counts.get("failed", 0),
+            "sync_rate": (synced / total * 100) if total > 0 else 0
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -2,13 +2,25 @@
 Task scheduling API routes.
 """
 
+import time
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response
 from pydantic import BaseModel
 
+from ..dependencies import get_scheduler
+
 router = APIRouter()
 
+# Seconds a rendered job listing stays valid; next_run_time moves on its own,
+# so the scheduler's jobs_version alone is not enough to invalidate it
+JOBS_CACHE_TTL = 1.0
+
+# Serialized job listing keyed by (scheduler, jobs_version); the key holds the
+# scheduler itself, since the id() of a discarded scheduler can be reused
+_jobs_cache = {"key": None, "expires_at": 0.0, "content": b"[]"}
+
 
 class TaskSchedule(BaseModel):
     """Task schedule request."""
@@ -17,39 +29,37 @@ class TaskSchedule(BaseModel):
 
 
 @router.get("/")
-async def list_tasks():
+async def list_tasks(scheduler=Depends(get_scheduler)):
     """List all scheduled tasks."""
-    from ..app import get_app_state
-
-    state = get_app_state()
-    scheduler = state.get("scheduler")
-
     if not scheduler:
         raise HTTPException(status_code=503, detail="Scheduler not available")
 
     try:
-        jobs = scheduler.get_jobs()
-        return [
-            {
-                "id": job.id,
-                "name": job.name,
-                "next_run_time": job.next_run_time.isoformat() if job.next_run_time else None,
-                "trigger": str(job.trigger)
-            }
-            for job in jobs
-        ]
+        key = (scheduler, scheduler.jobs_version)
+        now = time.monotonic()
+
+        if _jobs_cache["key"] != key or now >= _jobs_cache["expires_at"]:
+            jobs = scheduler.get_jobs()
+            _jobs_cache["content"] = orjson.dumps([
+                {
+                    "id": job.id,
+                    "name": job.name,
+                    "next_run_time": job.next_run_time.isoformat() if job.next_run_time else None,
+                    "trigger": str(job.trigger)
+                }
+                for job in jobs
+            ])
+            _jobs_cache["key"] = key
+            _jobs_cache["expires_at"] = now + JOBS_CACHE_TTL
+
+        return Response(content=_jobs_cache["content"], media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/sync/schedule")
-async def schedule_sync(schedule: TaskSchedule):
+async def schedule_sync(schedule: TaskSchedule, scheduler=Depends(get_scheduler)):
     """Schedule automatic synchronization."""
-    from ..app import get_app_state
-
-    state = get_app_state()
-    scheduler = state.get("scheduler")
-
     if not scheduler:
         raise HTTPException(status_code=503, detail="Scheduler not available")
 
@@ -68,13 +78,8 @@ async def schedule_sync(schedule: TaskSchedule):
 
 
 @router.post("/sync/now")
-async def execute_sync_now():
+async def execute_sync_now(scheduler=Depends(get_scheduler)):
     """Execute synchronization immediately."""
-    from ..app import get_app_state
-
-    state = get_app_state()
-    scheduler = state.get("scheduler")
-
     if not scheduler:
         raise HTTPException(status_code=503, detail="Scheduler not available")
 
@@ -86,13 +91,8 @@ async def execute_sync_now():
 
 
 @router.get("/{job_id}")
-async def get_task_status(job_id: str):
+async def get_task_status(job_id: str, scheduler=Depends(get_scheduler)):
     """Get task status."""
-    from ..app import get_app_state
-
-    state = get_app_state()
-    scheduler = state.get("scheduler")
-
     if not scheduler:
         raise HTTPException(status_code=503, detail="Scheduler not available")
 
@@ -108,13 +108,8 @@ async def get_task_status(job_id: str):
 
 
 @router.post("/start")
-async def start_scheduler():
+async def start_scheduler(scheduler=Depends(get_scheduler)):
     """Start the scheduler."""
-    from ..app import get_app_state
-
-    state = get_app_state()
-    scheduler = state.get("scheduler")
-
     if not scheduler:
         raise HTTPException(status_code=503, detail="Scheduler not available")
 
@@ -129,13 +124,8 @@ async def start_scheduler():
 
 
 @router.post("/stop")
-async def stop_scheduler():
+async def stop_scheduler(scheduler=Depends(get_scheduler)):
     """Stop the scheduler."""
-    from ..app import get_app_state
-
-    state = get_app_state()
-    scheduler = state.get("scheduler")
-
     if not scheduler:
         raise HTTPException(status_code=503, detail="Scheduler not available")
 
@@ -150,13 +140,8 @@ async def stop_scheduler():
 
 
 @router.post("/{job_id}/pause")
-async def pause_task(job_id: str):
+async def pause_task(job_id: str, scheduler=Depends(get_scheduler)):
     """Pause a scheduled task."""
-    from ..app import get_app_state
-
-    state = get_app_state()
-    scheduler = state.get("scheduler")
-
     if not scheduler:
         raise HTTPException(status_code=503, detail="Scheduler not available")
 
@@ -175,13 +160,8 @@ async def pause_task(job_id: str):
 
 
 @router.post("/{job_id}/resume")
-async def resume_task(job_id: str):
+async def resume_task(job_id: str, scheduler=Depends(get_scheduler)):
     """Resume a paused task."""
-    from ..app import get_app_state
-
-    state = get_app_state()
-    scheduler = state.get("scheduler")
-
     if not scheduler:
         raise HTTPException(status_code=503, detail="Scheduler not available")
 
@@ -25,9 +25,8 @@ SVG_FILE = STATIC_DIR / "images" / "favicon.svg"
 ICO_FILE = STATIC_DIR / "images" / "favicon.ico"
 PNG_FILE = STATIC_DIR / "images" / "apple-touch-icon.png"
 
-def svg_to_png(svg_path, size):
-    """Convert SVG to PNG at specified size"""
-    svg_data = open(svg_path, 'rb').read()
+def svg_to_png(svg_data, size):
+    """Convert SVG bytes to PNG at specified size"""
     png_data = cairosvg.svg2png(bytestring=svg_data, output_width=size, output_height=size)
     return Image.open(io.BytesIO(png_data))
 
@@ -39,13 +38,19 @@ def generate_favicon():
 
     print("正在生成 favicon.ico...")
 
+    svg_data = SVG_FILE.read_bytes()
+
+    # Render the SVG once at the largest size (180x180 Apple Touch Icon)
+    # and downsample it for the smaller ICO sizes
+    apple_icon = svg_to_png(svg_data, 180)
+
     # Generate multiple sizes for ICO
     sizes = [16, 32, 48, 64]
     images = []
 
     for size in sizes:
         print(f"  - 生成 {size}x{size} 图标...")
-        img = svg_to_png(SVG_FILE, size)
+        img = apple_icon.resize((size, size), Image.LANCZOS)
         images.append(img)
 
     # Save as ICO
@@ -59,7 +64,6 @@ def generate_favicon():
 
     # Also generate 180x180 for Apple Touch Icon
     print("正在生成 apple-touch-icon.png (180x180)...")
-    apple_icon = svg_to_png(SVG_FILE, 180)
     apple_icon.save(PNG_FILE, format='PNG')
 
     print("\n✓ 成功生成：")
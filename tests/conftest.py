@@ -0,0 +1,151 @@
+"""
+Shared pytest fixtures.
+
+Session-scoped fixtures here are created once per test process, so each
+pytest-xdist worker gets its own copy.
+"""
+
+import httpx
+import pytest
+from sqlalchemy import event
+
+from src.models import Database
+
+
+class FakeGitHubAPI:
+    """Serves canned responses by request path and records every request."""
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+
+    def reset(self):
+        """Forget configured routes and recorded requests."""
+        self.routes.clear()
+        self.requests.clear()
+
+    def handle(self, request):
+        """MockTransport handler."""
+        self.requests.append(request)
+        route = self.routes.get(request.url.path)
+        if route is None:
+            return httpx.Response(404, json={"message": "Not Found"})
+        if isinstance(route, Exception):
+            raise route
+        if callable(route):
+            return route(request)
+        return route
+
+
+@pytest.fixture(scope="session")
+def github_api():
+    """Fake GitHub API shared by the whole session."""
+    return FakeGitHubAPI()
+
+
+@pytest.fixture(scope="session")
+def mock_transport(github_api):
+    """Transport routing requests to the fake GitHub API."""
+    return httpx.MockTransport(github_api.handle)
+
+
+def _enable_sqlite_savepoints(engine):
+    """Let pysqlite honour BEGIN/SAVEPOINT so per-test rollbacks work.
+
+    See "Serializable isolation / Savepoints / Transactional DDL" in the
+    SQLAlchemy SQLite dialect documentation.
+    """
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+
+# Durability settings traded for speed on file-backed test databases, which
+# are thrown away; in-memory databases never touch the disk
+_TEST_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _apply_test_pragmas(engine):
+    """Apply the test PRAGMAs to new connections of a file-backed SQLite ``engine``."""
+    if engine.dialect.name != "sqlite" or engine.url.database in (None, "", ":memory:"):
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in _TEST_SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+@pytest.fixture(scope="session")
+def apply_test_pragmas():
+    """Helper applying the test PRAGMAs to a database engine."""
+    return _apply_test_pragmas
+
+
+@pytest.fixture(scope="session")
+def test_db():
+    """Create an in-memory test database shared by the whole session.
+
+    Tests must not commit through it; use ``isolated_db`` or ``db_session``
+    for changes that are rolled back, or ``fresh_db`` when a test needs its
+    own database.
+    """
+    db = Database("sqlite:///:memory:")
+    _enable_sqlite_savepoints(db.engine)
+    db.init_db()
+    yield db
+    db.drop_db()
+
+
+@pytest.fixture
+def isolated_db(test_db):
+    """Shared test database whose changes are rolled back after the test.
+
+    Sessions opened through the database join an outer transaction on a
+    single connection; their commits only release a savepoint.
+    """
+    original_kw = dict(test_db.SessionLocal.kw)
+    connection = test_db.engine.connect()
+    transaction = connection.begin()
+    test_db.SessionLocal.configure(
+        bind=connection,
+        join_transaction_mode="create_savepoint"
+    )
+    yield test_db
+    test_db.SessionLocal.kw = original_kw
+    transaction.rollback()
+    connection.close()
+    test_db.invalidate_sync_status_counts()
+
+
+@pytest.fixture
+def db_session(isolated_db):
+    """Session on the shared database whose changes are rolled back after the test.
+
+    Instances keep their loaded attributes after a commit, so tests read
+    them back without another SELECT.
+    """
+    session = isolated_db.SessionLocal(expire_on_commit=False)
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def fresh_db():
+    """Create a dedicated in-memory test database."""
+    db = Database("sqlite:///:memory:")
+    db.init_db()
+    yield db
+    db.drop_db()
@@ -7,13 +7,13 @@ from pathlib import Path
 import pytest
 from dotenv import load_dotenv
 
-from src.config.config import ConfigManager, GitHubConfig, GiteaConfig, load_config
+from src.config.config import ConfigManager, GitHubConfig, GiteaConfig, SyncConfig, load_config
 
 
-@pytest.fixture
-def temp_env_file(tmp_path):
-    """Create a temporary .env file for testing."""
-    env_file = tmp_path / ".env"
+@pytest.fixture(scope="session")
+def temp_env_file(tmp_path_factory):
+    """Create a temporary .env file shared by the tests (read-only)."""
+    env_file = tmp_path_factory.mktemp("env") / ".env"
     env_file.write_text("""
 # GitHub Configuration
 GITHUB_TOKEN=test_token_12345
@@ -69,6 +69,14 @@ def test_gitea_config_validation():
     assert config.username == "test_user"
 
 
+def test_sync_config_shallow_mirror_rejects_clone_cache():
+    """Test shallow mirrors cannot be combined with the clone cache."""
+    assert SyncConfig(shallow_mirror=True).shallow_mirror is True
+
+    with pytest.raises(ValueError):
+        SyncConfig(clone_cache=True, shallow_mirror=True)
+
+
 def test_config_manager_load(temp_env_file):
     """Test config manager loading configuration."""
     manager = ConfigManager(env_file=str(temp_env_file))
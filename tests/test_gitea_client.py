@@ -2,15 +2,36 @@
 Tests for Gitea API client.
 """
 
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import MagicMock, create_autospec, patch
 import httpx
 
 from src.config.config import GiteaConfig
 from src.clients.gitea_client import GiteaClient, validate_gitea_token
 
+# Captured before the module-wide patch replaces httpx.Client
+_HTTPX_CLIENT = httpx.Client
 
-@pytest.fixture
+# Request attached to the HTTPStatusErrors raised by the error-path tests
+_FAKE_REQUEST = MagicMock()
+
+def _conn_err(*args, **kwargs):
+    """Side effect raising a fresh transport failure on every call."""
+    raise httpx.RequestError("Connection failed")
+
+
+def _resp(data=None, status=200):
+    """Build a minimal stand-in for an httpx.Response."""
+    return SimpleNamespace(
+        json=lambda: data,
+        status_code=status,
+        raise_for_status=lambda: None
+    )
+
+
+@pytest.fixture(scope="session")
 def gitea_config():
     """Create a test Gitea configuration."""
     return GiteaConfig(
@@ -20,38 +41,52 @@ def gitea_config():
     )
 
 
-@pytest.fixture
-def gitea_client(gitea_config):
-    """Create a test Gitea client."""
+@pytest.fixture(scope="module", autouse=True)
+def mock_httpx_client():
+    """Replace httpx.Client for the whole module."""
     with patch('httpx.Client') as mock_client:
-        mock_client_instance = MagicMock()
-        mock_client.return_value = mock_client_instance
-        client = GiteaClient(gitea_config)
-        client.session = mock_client_instance
-        yield client
+        mock_client.return_value = MagicMock()
+        yield mock_client
 
 
-def test_gitea_client_initialization(gitea_config):
-    """Test GiteaClient initialization."""
-    with patch('httpx.Client') as mock_client:
-        mock_instance = MagicMock()
-        mock_client.return_value = mock_instance
+@pytest.fixture(scope="module")
+def gitea_client(gitea_config, mock_httpx_client):
+    """Create a test Gitea client shared by the whole module."""
+    return GiteaClient(gitea_config)
+
+
+@pytest.fixture
+def respond_get(gitea_client):
+    """Return a helper that stubs the response of the next session GET."""
+    def _respond(data=None, status=200):
+        gitea_client.session.get.return_value = _resp(data, status)
+    return _respond
+
 
-        client = GiteaClient(gitea_config)
+@pytest.fixture(autouse=True)
+def reset_mocks(mock_httpx_client, gitea_client):
+    """Start every test with clean mock call history and responses."""
+    mock_httpx_client.reset_mock()
+    gitea_client.session.reset_mock(return_value=True, side_effect=True)
 
-        assert client.config == gitea_config
-        assert client.session is not None
 
-        # Verify client was created with correct parameters
-        mock_client.assert_called_once()
-        call_kwargs = mock_client.call_args[1]
-        assert call_kwargs['base_url'] == "https://gitea.example.com"
-        assert 'Authorization' in call_kwargs['headers']
-        assert 'token test_token_456' in call_kwargs['headers']['Authorization']
-        assert call_kwargs['timeout'] == 30.0
+def test_gitea_client_initialization(gitea_config, mock_httpx_client):
+    """Test GiteaClient initialization."""
+    client = GiteaClient(gitea_config)
+
+    assert client.config == gitea_config
+    assert client.session is not None
 
+    # Verify client was created with correct parameters
+    mock_httpx_client.assert_called_once()
+    call_kwargs = mock_httpx_client.call_args[1]
+    assert call_kwargs['base_url'] == "https://gitea.example.com"
+    assert 'Authorization' in call_kwargs['headers']
+    assert 'token test_token_456' in call_kwargs['headers']['Authorization']
+    assert call_kwargs['timeout'] == 30.0
 
-def test_gitea_client_url_trailing_slash():
+
+def test_gitea_client_url_trailing_slash(mock_httpx_client):
     """Test that trailing slash is removed from Gitea URL."""
     config = GiteaConfig(
         url="https://gitea.example.com/",
@@ -59,44 +94,55 @@ def test_gitea_client_url_trailing_slash():
         token="test_token"
     )
 
-    with patch('httpx.Client') as mock_client:
-        mock_instance = MagicMock()
-        mock_client.return_value = mock_instance
-
-        client = GiteaClient(config)
-
-        # URL should not have trailing slash
-        call_kwargs = mock_client.call_args[1]
-        assert call_kwargs['base_url'] == "https://gitea.example.com"
-
-
-def test_get_user(gitea_client):
-    """Test getting user information."""
-    user_data = {
-        "login": "testuser",
-        "id": 123,
-        "full_name": "Test User"
-    }
-
-    mock_response = MagicMock()
-    mock_response.json.return_value = user_data
-    gitea_client.session.get.return_value = mock_response
-
-    result = gitea_client.get_user()
-
-    assert result == user_data
-    gitea_client.session.get.assert_called_once_with("/api/v1/user")
+    GiteaClient(config)
+
+    # URL should not have trailing slash
+    call_kwargs = mock_httpx_client.call_args[1]
+    assert call_kwargs['base_url'] == "https://gitea.example.com"
+
+
+@pytest.mark.parametrize("method_name, args, expected_path, payload, expected", [
+    (
+        "get_user",
+        (),
+        "/api/v1/user",
+        {"login": "testuser", "id": 123, "full_name": "Test User"},
+        {"login": "testuser", "id": 123, "full_name": "Test User"}
+    ),
+    (
+        "get_repository",
+        ("testuser", "test-repo"),
+        "/api/v1/repos/testuser/test-repo",
+        {"id": 1, "name": "test-repo", "clone_url": "https://gitea.example.com/testuser/test-repo.git"},
+        {"id": 1, "name": "test-repo", "clone_url": "https://gitea.example.com/testuser/test-repo.git"}
+    ),
+    (
+        "get_server_version",
+        (),
+        "/api/v1/version",
+        {"version": "1.19.0"},
+        "1.19.0"
+    ),
+])
+def test_simple_get_endpoints(gitea_client, respond_get, method_name, args, expected_path, payload, expected):
+    """Test GET endpoints that return the response body (or a field of it)."""
+    respond_get(payload)
+
+    result = getattr(gitea_client, method_name)(*args)
+
+    assert result == expected
+    gitea_client.session.get.assert_called_once_with(expected_path)
 
 
 def test_get_user_request_error(gitea_client):
     """Test handling of request errors in get_user."""
-    gitea_client.session.get.side_effect = httpx.RequestError("Connection failed")
+    gitea_client.session.get.side_effect = _conn_err
 
     with pytest.raises(httpx.RequestError):
         gitea_client.get_user()
 
 
-def test_get_repositories(gitea_client):
+def test_get_repositories(gitea_client, respond_get):
     """Test getting user repositories."""
     repos_data = [
         {
@@ -111,9 +157,7 @@ def test_get_repositories(gitea_client):
         }
     ]
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = repos_data
-    gitea_client.session.get.return_value = mock_response
+    respond_get(repos_data)
 
     result = gitea_client.get_repositories(page=1, limit=50)
 
@@ -127,23 +171,18 @@ def test_get_repositories(gitea_client):
     assert call_args[1]['params']['limit'] == 50
 
 
-def test_repository_exists_true(gitea_client):
+def test_repository_exists_true(gitea_client, respond_get):
     """Test checking if repository exists (positive case)."""
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"id": 1, "name": "test-repo"}
-    gitea_client.session.get.return_value = mock_response
+    respond_get({"id": 1, "name": "test-repo"}, status=200)
 
     result = gitea_client.repository_exists("testuser", "test-repo")
 
     assert result is True
 
 
-def test_repository_exists_false(gitea_client):
+def test_repository_exists_false(gitea_client, respond_get):
     """Test checking if repository exists (negative case)."""
-    mock_response = MagicMock()
-    mock_response.status_code = 404
-    gitea_client.session.get.return_value = mock_response
+    respond_get(status=404)
 
     result = gitea_client.repository_exists("testuser", "nonexistent")
 
@@ -167,8 +206,7 @@ def test_create_repository(gitea_client):
         "description": "A new test repository"
     }
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = repo_data
+    mock_response = _resp(repo_data)
     gitea_client.session.post.return_value = mock_response
 
     result = gitea_client.create_repository(
@@ -189,11 +227,10 @@ def test_create_repository(gitea_client):
 
 def test_create_repository_already_exists(gitea_client):
     """Test creating repository that already exists."""
-    mock_response = MagicMock()
-    mock_response.status_code = 422
+    mock_response = _resp(status=422)
     gitea_client.session.post.side_effect = httpx.HTTPStatusError(
         "Unprocessable Entity",
-        request=MagicMock(),
+        request=_FAKE_REQUEST,
         response=mock_response
     )
 
@@ -201,32 +238,12 @@ def test_create_repository_already_exists(gitea_client):
         gitea_client.create_repository(name="existing-repo")
 
 
-def test_get_repository(gitea_client):
-    """Test getting repository information."""
-    repo_data = {
-        "id": 1,
-        "name": "test-repo",
-        "owner": {"login": "testuser"},
-        "clone_url": "https://gitea.example.com/testuser/test-repo.git"
-    }
-
-    mock_response = MagicMock()
-    mock_response.json.return_value = repo_data
-    gitea_client.session.get.return_value = mock_response
-
-    result = gitea_client.get_repository("testuser", "test-repo")
-
-    assert result == repo_data
-    gitea_client.session.get.assert_called_once_with("/api/v1/repos/testuser/test-repo")
-
-
 def test_get_repository_not_found(gitea_client):
     """Test getting non-existent repository."""
-    mock_response = MagicMock()
-    mock_response.status_code = 404
+    mock_response = _resp(status=404)
     gitea_client.session.get.side_effect = httpx.HTTPStatusError(
         "Not Found",
-        request=MagicMock(),
+        request=_FAKE_REQUEST,
         response=mock_response
     )
 
@@ -242,8 +259,7 @@ def test_update_repository(gitea_client):
         "description": "Updated description"
     }
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = updated_repo
+    mock_response = _resp(updated_repo)
     gitea_client.session.patch.return_value = mock_response
 
     result = gitea_client.update_repository(
@@ -262,8 +278,7 @@ def test_update_repository(gitea_client):
 
 def test_update_repository_multiple_fields(gitea_client):
     """Test updating multiple repository fields."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = {}
+    mock_response = _resp({})
     gitea_client.session.patch.return_value = mock_response
 
     gitea_client.update_repository(
@@ -282,7 +297,7 @@ def test_update_repository_multiple_fields(gitea_client):
 
 def test_delete_repository(gitea_client):
     """Test deleting a repository."""
-    mock_response = MagicMock()
+    mock_response = _resp()
     gitea_client.session.delete.return_value = mock_response
 
     result = gitea_client.delete_repository("testuser", "test-repo")
@@ -293,11 +308,10 @@ def test_delete_repository(gitea_client):
 
 def test_delete_repository_not_found(gitea_client):
     """Test deleting non-existent repository."""
-    mock_response = MagicMock()
-    mock_response.status_code = 404
+    mock_response = _resp(status=404)
     gitea_client.session.delete.side_effect = httpx.HTTPStatusError(
         "Not Found",
-        request=MagicMock(),
+        request=_FAKE_REQUEST,
         response=mock_response
     )
 
@@ -313,8 +327,7 @@ def test_create_webhook(gitea_client):
         "url": "https://example.com/webhook"
     }
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = webhook_data
+    mock_response = _resp(webhook_data)
     gitea_client.session.post.return_value = mock_response
 
     result = gitea_client.create_webhook(
@@ -334,8 +347,7 @@ def test_create_webhook(gitea_client):
 
 def test_create_webhook_custom_events(gitea_client):
     """Test creating webhook with custom events."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"id": 1}
+    mock_response = _resp({"id": 1})
     gitea_client.session.post.return_value = mock_response
 
     gitea_client.create_webhook(
@@ -349,7 +361,7 @@ def test_create_webhook_custom_events(gitea_client):
     assert call_args[1]['json']['events'] == ["push", "release"]
 
 
-def test_push_to_repository(gitea_client):
+def test_push_to_repository(gitea_client, respond_get):
     """Test simulating push to repository."""
     repo_data = {
         "id": 1,
@@ -357,16 +369,14 @@ def test_push_to_repository(gitea_client):
         "clone_url": "https://gitea.example.com/testuser/test-repo.git"
     }
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = repo_data
-    gitea_client.session.get.return_value = mock_response
+    respond_get(repo_data)
 
     result = gitea_client.push_to_repository("testuser", "test-repo")
 
     assert result is True
 
 
-def test_push_to_repository_no_clone_url(gitea_client):
+def test_push_to_repository_no_clone_url(gitea_client, respond_get):
     """Test push to repository with no clone URL."""
     repo_data = {
         "id": 1,
@@ -374,20 +384,16 @@ def test_push_to_repository_no_clone_url(gitea_client):
         # No clone_url field
     }
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = repo_data
-    gitea_client.session.get.return_value = mock_response
+    respond_get(repo_data)
 
     result = gitea_client.push_to_repository("testuser", "test-repo")
 
     assert result is False
 
 
-def test_validate_token_valid(gitea_client):
+def test_validate_token_valid(gitea_client, respond_get):
     """Test token validation with valid token."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"login": "testuser"}
-    gitea_client.session.get.return_value = mock_response
+    respond_get({"login": "testuser"})
 
     result = gitea_client.validate_token()
 
@@ -396,34 +402,16 @@ def test_validate_token_valid(gitea_client):
 
 def test_validate_token_invalid(gitea_client):
     """Test token validation with invalid token."""
-    gitea_client.session.get.side_effect = httpx.RequestError("Unauthorized")
+    gitea_client.session.get.side_effect = _conn_err
 
     result = gitea_client.validate_token()
 
     assert result is False
 
 
-def test_get_server_version(gitea_client):
-    """Test getting Gitea server version."""
-    version_data = {
-        "version": "1.19.0"
-    }
-
-    mock_response = MagicMock()
-    mock_response.json.return_value = version_data
-    gitea_client.session.get.return_value = mock_response
-
-    result = gitea_client.get_server_version()
-
-    assert result == "1.19.0"
-    gitea_client.session.get.assert_called_once_with("/api/v1/version")
-
-
-def test_get_server_version_unknown(gitea_client):
+def test_get_server_version_unknown(gitea_client, respond_get):
     """Test getting server version when field is missing."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = {}
-    gitea_client.session.get.return_value = mock_response
+    respond_get({})
 
     result = gitea_client.get_server_version()
 
@@ -432,7 +420,7 @@ def test_get_server_version_unknown(gitea_client):
 
 def test_get_server_version_error(gitea_client):
     """Test handling error when getting server version."""
-    gitea_client.session.get.side_effect = httpx.RequestError("Connection failed")
+    gitea_client.session.get.side_effect = _conn_err
 
     with pytest.raises(httpx.RequestError):
         gitea_client.get_server_version()
@@ -445,6 +433,30 @@ def test_close(gitea_client):
     gitea_client.session.close.assert_called_once()
 
 
+def test_session_call_signatures(gitea_client, monkeypatch):
+    """Test the client only uses real httpx.Client methods with valid arguments."""
+    session = create_autospec(_HTTPX_CLIENT, instance=True)
+    session.get.return_value = _resp({"id": 1})
+    session.post.return_value = _resp({"id": 1})
+    session.patch.return_value = _resp({"id": 1})
+    session.delete.return_value = _resp()
+    monkeypatch.setattr(gitea_client, "session", session)
+
+    gitea_client.get_user()
+    gitea_client.get_repositories(page=2, limit=10)
+    gitea_client.create_repository(name="new-repo", org="test-org")
+    gitea_client.update_repository("testuser", "test-repo", private=True)
+    gitea_client.delete_repository("testuser", "test-repo")
+    gitea_client.create_webhook("testuser", "test-repo", url="https://example.com/webhook")
+    gitea_client.close()
+
+    assert session.get.call_count == 2
+    assert session.post.call_count == 2
+    session.patch.assert_called_once()
+    session.delete.assert_called_once()
+    session.close.assert_called_once()
+
+
 def test_close_with_error(gitea_client):
     """Test closing client when session close fails."""
     gitea_client.session.close.side_effect = Exception("Close failed")
@@ -453,55 +465,6 @@ def test_close_with_error(gitea_client):
     gitea_client.close()
 
 
-def test_multiple_api_calls(gitea_client):
-    """Test multiple API calls in sequence."""
-    user_response = MagicMock()
-    user_response.json.return_value = {"login": "testuser"}
-
-    repos_response = MagicMock()
-    repos_response.json.return_value = [{"name": "repo1"}]
-
-    gitea_client.session.get.side_effect = [user_response, repos_response]
-
-    user = gitea_client.get_user()
-    repos = gitea_client.get_repositories()
-
-    assert user["login"] == "testuser"
-    assert len(repos) == 1
-
-
-def test_repository_crud_operations(gitea_client):
-    """Test complete CRUD operations."""
-    # Create
-    create_response = MagicMock()
-    create_response.json.return_value = {"id": 1, "name": "test-repo"}
-    gitea_client.session.post.return_value = create_response
-
-    result = gitea_client.create_repository(name="test-repo")
-    assert result["name"] == "test-repo"
-
-    # Get
-    get_response = MagicMock()
-    get_response.json.return_value = {"id": 1, "name": "test-repo"}
-    gitea_client.session.get.return_value = get_response
-
-    result = gitea_client.get_repository("testuser", "test-repo")
-    assert result["name"] == "test-repo"
-
-    # Update
-    update_response = MagicMock()
-    update_response.json.return_value = {"id": 1, "name": "test-repo", "private": True}
-    gitea_client.session.patch.return_value = update_response
-
-    result = gitea_client.update_repository("testuser", "test-repo", private=True)
-    assert result["private"] is True
-
-    # Delete
-    gitea_client.session.delete.return_value = MagicMock()
-    result = gitea_client.delete_repository("testuser", "test-repo")
-    assert result is True
-
-
 def test_gitea_config_attributes(gitea_config):
     """Test Gitea config has required attributes."""
     assert hasattr(gitea_config, 'url')
@@ -512,10 +475,8 @@ def test_gitea_config_attributes(gitea_config):
     assert gitea_config.token == "test_token_456"
 
 
-def test_validate_gitea_token_async():
+async def test_validate_gitea_token_async():
     """Test async token validation helper."""
-    import asyncio
-
     with patch('src.clients.gitea_client.GiteaClient') as mock_client_class:
         mock_client = MagicMock()
         mock_client.validate_token.return_value = True
@@ -528,8 +489,7 @@ def test_validate_gitea_token_async():
         )
 
         # Run async version for testing
-        from src.clients.gitea_client import validate_gitea_token
-        result = asyncio.run(validate_gitea_token(config))
+        result = await validate_gitea_token(config)
 
         assert result is True
         mock_client.close.assert_called_once()
@@ -537,8 +497,7 @@ def test_validate_gitea_token_async():
 
 def test_webhook_payload_structure(gitea_client):
     """Test webhook payload has correct structure."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"id": 1}
+    mock_response = _resp({"id": 1})
     gitea_client.session.post.return_value = mock_response
 
     gitea_client.create_webhook(
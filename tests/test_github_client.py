@@ -2,6 +2,8 @@
 Tests for GitHub API client.
 """
 
+import re
+
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 import httpx
@@ -9,8 +11,20 @@ import httpx
 from src.config.config import GitHubConfig
 from src.clients.github_client import GitHubClient, validate_github_token
 
+# Error messages expected by the pytest.raises(match=...) checks
+_NOT_FOUND = re.compile(r"Repository not found")
+_INVALID_PROTO = re.compile(r"Invalid protocol")
+
+# Repository listings served by the pagination tests
+_PAGE1 = [{"id": i, "name": f"repo{i}"} for i in range(1, 101)]
+_PAGE2 = [{"id": i, "name": f"repo{i}"} for i in range(101, 121)]
+_PAGES_OF_50 = [
+    [{"id": i, "name": f"repo{i}"} for i in range(page_num * 50, (page_num + 1) * 50)]
+    for page_num in range(2)
+]
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def github_config():
     """Create a test GitHub configuration."""
     return GitHubConfig(
@@ -19,15 +33,45 @@ def github_config():
     )
 
 
-@pytest.fixture
-def github_client(github_config):
-    """Create a test GitHub client."""
-    with patch('httpx.Client') as mock_client:
-        mock_client_instance = MagicMock()
-        mock_client.return_value = mock_client_instance
-        client = GitHubClient(github_config)
-        client.session = mock_client_instance
-        yield client
+def _paged(pages):
+    """Build a route serving ``pages`` by the ``page`` query parameter.
+
+    Pages past the end are empty, and every page but the last advertises
+    a next page through the Link header like the GitHub API does.
+    """
+    def handler(request):
+        page = int(request.url.params.get("page", 1))
+        body = pages[page - 1] if page <= len(pages) else []
+        headers = {"Link": '<https://api.github.com/user/repos>; rel="next"'} if page < len(pages) else {}
+        return httpx.Response(200, json=body, headers=headers)
+    return handler
+
+
+@pytest.fixture(scope="module")
+def github_client(github_config, mock_transport):
+    """Create a test GitHub client backed by the fake GitHub API."""
+    client = GitHubClient(github_config)
+    client.session.close()
+    client.session = httpx.Client(
+        transport=mock_transport,
+        base_url=github_config.api_url,
+        headers=client.session.headers
+    )
+    yield client
+    client.session.close()
+
+
+@pytest.fixture(autouse=True)
+def reset_github_api(github_api):
+    """Start every test with no routes and no recorded requests."""
+    github_api.reset()
+
+
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    """Drop shared HTTP sessions so each test builds its own."""
+    yield
+    GitHubClient.shutdown_all()
 
 
 def test_github_client_initialization(github_config):
@@ -48,35 +92,74 @@ def test_github_client_initialization(github_config):
         assert 'Authorization' in call_kwargs['headers']
         assert 'token test_token_123' in call_kwargs['headers']['Authorization']
         assert call_kwargs['timeout'] == 30.0
-
-
-def test_get_user(github_client):
-    """Test getting user information."""
-    user_data = {
-        "login": "testuser",
-        "id": 12345,
-        "name": "Test User"
-    }
-
-    mock_response = MagicMock()
-    mock_response.json.return_value = user_data
-    github_client.session.get.return_value = mock_response
-
-    result = github_client.get_user()
-
-    assert result == user_data
-    github_client.session.get.assert_called_once_with("/user")
-
-
-def test_get_user_request_error(github_client):
+        # Shared by every sync worker; keep httpx's default connection limits
+        assert 'limits' not in call_kwargs
+
+
+_REPO_URLS = {
+    "clone_url": "https://github.com/testuser/test-repo.git",
+    "ssh_url": "git@github.com:testuser/test-repo.git"
+}
+
+
+@pytest.mark.parametrize("method, args, path, body, expected", [
+    (
+        "get_user", (), "/user",
+        {"login": "testuser", "id": 12345, "name": "Test User"},
+        {"login": "testuser", "id": 12345, "name": "Test User"}
+    ),
+    (
+        "get_repository", ("testuser", "test-repo"), "/repos/testuser/test-repo",
+        {"id": 1, "name": "test-repo", "url": "https://github.com/testuser/test-repo"},
+        {"id": 1, "name": "test-repo", "url": "https://github.com/testuser/test-repo"}
+    ),
+    (
+        "get_repository_size", ("testuser", "test-repo"), "/repos/testuser/test-repo",
+        {"id": 1, "name": "test-repo", "size": 1024},  # size in KB
+        1024
+    ),
+    (
+        "get_repository_size", ("testuser", "empty-repo"), "/repos/testuser/empty-repo",
+        {"size": 0},
+        0
+    ),
+    (
+        "get_repository_clone_url", ("testuser", "test-repo", "https"), "/repos/testuser/test-repo",
+        _REPO_URLS,
+        "https://github.com/testuser/test-repo.git"
+    ),
+    (
+        "get_repository_clone_url", ("testuser", "test-repo", "ssh"), "/repos/testuser/test-repo",
+        _REPO_URLS,
+        "git@github.com:testuser/test-repo.git"
+    ),
+    (
+        "search_repositories", ("nonexistentlanguage",), "/search/repositories",
+        {"items": []},
+        []
+    ),
+], ids=[
+    "user", "repository", "size", "size_zero", "clone_url_https", "clone_url_ssh", "search_empty"
+])
+def test_get_endpoints(github_client, github_api, method, args, path, body, expected):
+    """Test single-request getters return the expected value."""
+    github_api.routes[path] = httpx.Response(200, json=body)
+
+    result = getattr(github_client, method)(*args)
+
+    assert result == expected
+    assert [r.url.path for r in github_api.requests] == [path]
+
+
+def test_get_user_request_error(github_client, github_api):
     """Test handling of request errors in get_user."""
-    github_client.session.get.side_effect = httpx.RequestError("Connection failed")
+    github_api.routes["/user"] = httpx.ConnectError("Connection failed")
 
     with pytest.raises(httpx.RequestError):
         github_client.get_user()
 
 
-def test_get_user_repositories(github_client):
+def test_get_user_repositories(github_client, github_api):
     """Test getting user repositories."""
     repos_data = [
         {
@@ -91,10 +174,7 @@ def test_get_user_repositories(github_client):
         }
     ]
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = repos_data
-    mock_response.headers.get.return_value = ""  # No next page
-    github_client.session.get.return_value = mock_response
+    github_api.routes["/user/repos"] = httpx.Response(200, json=repos_data)  # No next page
 
     result = github_client.get_user_repositories(per_page=30, page=1)
 
@@ -103,82 +183,51 @@ def test_get_user_repositories(github_client):
     assert result[1]["name"] == "repo2"
 
     # Verify correct parameters
-    github_client.session.get.assert_called_once()
-    call_args = github_client.session.get.call_args
-    assert call_args[0][0] == "/user/repos"
-    assert call_args[1]['params']['per_page'] == 30
-    assert call_args[1]['params']['page'] == 1
-
-
-def test_get_user_repositories_per_page_limit(github_client):
+    assert len(github_api.requests) == 1
+    request = github_api.requests[0]
+    assert request.url.path == "/user/repos"
+    assert request.url.params["per_page"] == "30"
+    assert request.url.params["page"] == "1"
+
+
+@pytest.mark.parametrize("requested, sent", [(200, 100), (30, 30)])
+@pytest.mark.parametrize("method, args, path, body", [
+    ("get_user_repositories", (), "/user/repos", []),
+    ("search_repositories", ("python",), "/search/repositories", {"items": []}),
+])
+def test_per_page_limit(github_client, github_api, method, args, path, body, requested, sent):
     """Test per_page parameter is limited to 100."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = []
-    mock_response.headers.get.return_value = ""
-    github_client.session.get.return_value = mock_response
+    github_api.routes[path] = httpx.Response(200, json=body)
 
-    github_client.get_user_repositories(per_page=200)
+    getattr(github_client, method)(*args, per_page=requested)
 
-    call_args = github_client.session.get.call_args
-    assert call_args[1]['params']['per_page'] == 100
+    assert github_api.requests[-1].url.params["per_page"] == str(sent)
 
 
-def test_get_all_user_repositories(github_client):
+def test_get_all_user_repositories(github_client, github_api):
     """Test getting all user repositories with pagination."""
-    page1_data = [{"id": i, "name": f"repo{i}"} for i in range(1, 101)]
-    page2_data = [{"id": i, "name": f"repo{i}"} for i in range(101, 121)]
-
-    mock_response = MagicMock()
-    mock_response.headers.get.return_value = ""
-    mock_response.json.side_effect = [page1_data, page2_data, []]
-
-    github_client.session.get.return_value = mock_response
+    github_api.routes["/user/repos"] = _paged([_PAGE1, _PAGE2])
 
     result = github_client.get_all_user_repositories()
 
     assert len(result) == 120
     assert result[0]["name"] == "repo1"
     assert result[100]["name"] == "repo101"
-
-
-def test_get_repository(github_client):
-    """Test getting repository information."""
-    repo_data = {
-        "id": 1,
-        "name": "test-repo",
-        "owner": {"login": "testuser"},
-        "url": "https://github.com/testuser/test-repo"
-    }
-
-    mock_response = MagicMock()
-    mock_response.json.return_value = repo_data
-    github_client.session.get.return_value = mock_response
-
-    result = github_client.get_repository("testuser", "test-repo")
-
-    assert result == repo_data
-    github_client.session.get.assert_called_once_with("/repos/testuser/test-repo")
+    assert [r.url.params["page"] for r in github_api.requests] == ["1", "2", "3"]
 
 
 def test_get_repository_not_found(github_client):
     """Test handling of 404 errors when getting repository."""
-    mock_response = MagicMock()
-    mock_response.status_code = 404
-    github_client.session.get.side_effect = httpx.HTTPStatusError(
-        "Not Found",
-        request=MagicMock(),
-        response=mock_response
-    )
-
-    with pytest.raises(ValueError, match="Repository not found"):
+    # Unknown paths are answered with 404 by the fake API
+    with pytest.raises(ValueError, match=_NOT_FOUND):
         github_client.get_repository("testuser", "nonexistent")
 
 
-def test_repository_exists_true(github_client):
+def test_repository_exists_true(github_client, github_api):
     """Test checking if repository exists (positive case)."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"id": 1, "name": "test-repo"}
-    github_client.session.get.return_value = mock_response
+    github_api.routes["/repos/testuser/test-repo"] = httpx.Response(
+        200, json={"id": 1, "name": "test-repo"}
+    )
 
     result = github_client.repository_exists("testuser", "test-repo")
 
@@ -187,78 +236,36 @@ def test_repository_exists_true(github_client):
 
 def test_repository_exists_false(github_client):
     """Test checking if repository exists (negative case)."""
-    mock_response = MagicMock()
-    mock_response.status_code = 404
-    github_client.session.get.side_effect = httpx.HTTPStatusError(
-        "Not Found",
-        request=MagicMock(),
-        response=mock_response
-    )
-
     result = github_client.repository_exists("testuser", "nonexistent")
 
     assert result is False
 
 
-def test_get_repository_clone_url_https(github_client):
-    """Test getting clone URL with HTTPS protocol."""
-    repo_data = {
-        "clone_url": "https://github.com/testuser/test-repo.git",
-        "ssh_url": "git@github.com:testuser/test-repo.git"
-    }
-
-    mock_response = MagicMock()
-    mock_response.json.return_value = repo_data
-    github_client.session.get.return_value = mock_response
-
-    result = github_client.get_repository_clone_url("testuser", "test-repo", protocol="https")
-
-    assert result == "https://github.com/testuser/test-repo.git"
-
-
-def test_get_repository_clone_url_ssh(github_client):
-    """Test getting clone URL with SSH protocol."""
-    repo_data = {
-        "clone_url": "https://github.com/testuser/test-repo.git",
-        "ssh_url": "git@github.com:testuser/test-repo.git"
-    }
-
-    mock_response = MagicMock()
-    mock_response.json.return_value = repo_data
-    github_client.session.get.return_value = mock_response
-
-    result = github_client.get_repository_clone_url("testuser", "test-repo", protocol="ssh")
-
-    assert result == "git@github.com:testuser/test-repo.git"
-
-
 def test_get_repository_clone_url_invalid_protocol(github_client):
     """Test invalid protocol raises ValueError."""
-    with pytest.raises(ValueError, match="Invalid protocol"):
+    with pytest.raises(ValueError, match=_INVALID_PROTO):
         github_client.get_repository_clone_url("testuser", "test-repo", protocol="ftp")
 
 
-def test_validate_token_valid(github_client):
+def test_validate_token_valid(github_client, github_api):
     """Test token validation with valid token."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"login": "testuser"}
-    github_client.session.get.return_value = mock_response
+    github_api.routes["/user"] = httpx.Response(200, json={"login": "testuser"})
 
     result = github_client.validate_token()
 
     assert result is True
 
 
-def test_validate_token_invalid(github_client):
+def test_validate_token_invalid(github_client, github_api):
     """Test token validation with invalid token."""
-    github_client.session.get.side_effect = httpx.RequestError("Unauthorized")
+    github_api.routes["/user"] = httpx.ConnectError("Unauthorized")
 
     result = github_client.validate_token()
 
     assert result is False
 
 
-def test_search_repositories(github_client):
+def test_search_repositories(github_client, github_api):
     """Test searching for repositories."""
     search_results = {
         "items": [
@@ -267,9 +274,7 @@ def test_search_repositories(github_client):
         ]
     }
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = search_results
-    github_client.session.get.return_value = mock_response
+    github_api.routes["/search/repositories"] = httpx.Response(200, json=search_results)
 
     result = github_client.search_repositories("python", per_page=10)
 
@@ -277,101 +282,83 @@ def test_search_repositories(github_client):
     assert result[0]["name"] == "result1"
 
     # Verify search parameters
-    call_args = github_client.session.get.call_args
-    assert call_args[0][0] == "/search/repositories"
-    assert call_args[1]['params']['q'] == "python"
-    assert call_args[1]['params']['sort'] == "stars"
+    request = github_api.requests[-1]
+    assert request.url.path == "/search/repositories"
+    assert request.url.params["q"] == "python"
+    assert request.url.params["sort"] == "stars"
 
 
-def test_search_repositories_per_page_limit(github_client):
-    """Test per_page parameter is limited to 100."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"items": []}
-    github_client.session.get.return_value = mock_response
-
-    github_client.search_repositories("python", per_page=200)
-
-    call_args = github_client.session.get.call_args
-    assert call_args[1]['params']['per_page'] == 100
-
+def test_close(github_config):
+    """Test closing a client closes its private session."""
+    client = GitHubClient(github_config)
+    client.close()
 
-def test_search_repositories_empty_results(github_client):
-    """Test search with no results."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"items": []}
-    github_client.session.get.return_value = mock_response
+    assert client.session.is_closed
 
-    result = github_client.search_repositories("nonexistentlanguage")
 
-    assert result == []
+def test_close_shared(github_config):
+    """Test closing a shared client leaves the shared session open."""
+    client = GitHubClient(github_config, shared_session=True)
+    client.close()
 
+    assert not client.session.is_closed
 
-def test_get_repository_size(github_client):
-    """Test getting repository size."""
-    repo_data = {
-        "id": 1,
-        "name": "test-repo",
-        "size": 1024  # in KB
-    }
-
-    mock_response = MagicMock()
-    mock_response.json.return_value = repo_data
-    github_client.session.get.return_value = mock_response
 
-    result = github_client.get_repository_size("testuser", "test-repo")
-
-    assert result == 1024
+def test_shared_session_reused(github_config):
+    """Test shared clients for the same endpoint and token share one session."""
+    client1 = GitHubClient(github_config, shared_session=True)
+    client2 = GitHubClient(github_config, shared_session=True)
+    other = GitHubClient(
+        GitHubConfig(token="other_token", api_url="https://api.github.com"),
+        shared_session=True
+    )
 
+    assert client1.session is client2.session
+    assert other.session is not client1.session
 
-def test_get_repository_size_zero(github_client):
-    """Test getting size of empty repository."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"size": 0}
-    github_client.session.get.return_value = mock_response
 
-    result = github_client.get_repository_size("testuser", "empty-repo")
+def test_private_session_not_shared(github_config):
+    """Test ad-hoc clients get their own session, kept out of the shared registry."""
+    shared = GitHubClient(github_config, shared_session=True)
+    private = GitHubClient(github_config)
 
-    assert result == 0
+    assert private.session is not shared.session
 
+    GitHubClient.shutdown_all()
 
-def test_close(github_client):
-    """Test closing the client."""
-    github_client.close()
+    assert shared.session.is_closed
+    assert not private.session.is_closed
+    private.close()
 
-    github_client.session.close.assert_called_once()
 
+def test_shutdown_all(github_config):
+    """Test shutdown_all closes shared sessions and later clients get a new one."""
+    client = GitHubClient(github_config, shared_session=True)
+    session = client.session
 
-def test_close_with_error(github_client):
-    """Test closing client when session close fails."""
-    github_client.session.close.side_effect = Exception("Close failed")
+    GitHubClient.shutdown_all()
 
-    # Should not raise exception
-    github_client.close()
+    assert session.is_closed
+    assert GitHubClient(github_config, shared_session=True).session is not session
 
 
-def test_context_manager_cleanup():
-    """Test that client properly cleans up on deletion."""
+def test_shutdown_all_with_error():
+    """Test shutdown_all when a session close fails."""
     with patch('httpx.Client') as mock_client:
-        mock_instance = MagicMock()
-        mock_client.return_value = mock_instance
-
-        config = GitHubConfig(token="test_token", api_url="https://api.github.com")
-        client = GitHubClient(config)
+        mock_client.return_value.close.side_effect = Exception("Close failed")
+        GitHubClient(
+            GitHubConfig(token="test_token", api_url="https://api.github.com"),
+            shared_session=True
+        )
 
-        # Delete should close session
-        del client
+        # Should not raise exception
+        GitHubClient.shutdown_all()
 
 
-def test_multiple_api_calls(github_client):
+def test_multiple_api_calls(github_client, github_api):
     """Test multiple API calls in sequence."""
-    user_response = MagicMock()
-    user_response.json.return_value = {"login": "testuser"}
-
-    repos_response = MagicMock()
-    repos_response.json.return_value = [{"name": "repo1"}]
-    repos_response.headers.get.return_value = ""
-
-    github_client.session.get.side_effect = [user_response, repos_response]
+    github_api.routes["/user"] = httpx.Response(200, json={"login": "testuser"})
+    github_api.routes["/user/repos"] = httpx.Response(200, json=[{"name": "repo1"}])
 
     user = github_client.get_user()
     repos = github_client.get_user_repositories()
@@ -380,28 +367,15 @@ def test_multiple_api_calls(github_client):
     assert len(repos) == 1
 
 
-def test_pagination_logic(github_client):
+def test_pagination_logic(github_client, github_api):
     """Test pagination through multiple pages."""
-    # Simulate 3 pages of results
-    page_responses = []
-    for page_num in range(3):
-        repos = [{"id": i, "name": f"repo{i}"} for i in range(page_num * 50, (page_num + 1) * 50)]
-        mock_response = MagicMock()
-        mock_response.json.return_value = repos
-        mock_response.headers.get.return_value = 'rel="next"' if page_num < 2 else ""
-        page_responses.append(mock_response)
-
-    github_client.session.get.side_effect = page_responses
-
-    # Only 2 calls should actually happen (third call returns empty list)
-    mock_response_empty = MagicMock()
-    mock_response_empty.json.return_value = []
-    mock_response_empty.headers.get.return_value = ""
-    github_client.session.get.side_effect = [page_responses[0], page_responses[1], mock_response_empty]
+    # Two pages, then an empty one ends the loop
+    github_api.routes["/user/repos"] = _paged(_PAGES_OF_50)
 
     result = github_client.get_all_user_repositories()
 
     assert len(result) == 100  # 50 + 50
+    assert len(github_api.requests) == 3
 
 
 def test_github_config_attributes(github_config):
@@ -412,10 +386,8 @@ def test_github_config_attributes(github_config):
     assert github_config.api_url == "https://api.github.com"
 
 
-def test_validate_github_token_async():
+async def test_validate_github_token_async():
     """Test async token validation helper."""
-    import asyncio
-
     with patch('src.clients.github_client.GitHubClient') as mock_client_class:
         mock_client = MagicMock()
         mock_client.validate_token.return_value = True
@@ -424,8 +396,7 @@ def test_validate_github_token_async():
         config = GitHubConfig(token="test_token", api_url="https://api.github.com")
 
         # Run async version for testing
-        from src.clients.github_client import validate_github_token
-        result = asyncio.run(validate_github_token(config))
+        result = await validate_github_token(config)
 
         assert result is True
         mock_client.close.assert_called_once()
@@ -2,6 +2,9 @@
 Tests for logging system.
 """
 
+import logging
+import re
+
 import pytest
 from pathlib import Path
 import tempfile
@@ -9,6 +12,11 @@ import tempfile
 from src.logger.logger import StructuredLogger, get_logger, create_logger
 
 
+def _assert_logged(caplog, level, message):
+    """Assert that the "test" logger emitted ``message`` at ``level``."""
+    assert ("test", level, message) in caplog.record_tuples
+
+
 @pytest.fixture
 def temp_log_dir():
     """Create a temporary directory for logs."""
@@ -28,43 +36,64 @@ def log_config(temp_log_dir):
     return LogConfig()
 
 
-def test_structured_logger_creation(log_config):
+@pytest.fixture
+def memory_log_config():
+    """Create a test log configuration without a log file."""
+    class LogConfig:
+        level = "DEBUG"
+        file_path = None
+        max_file_size = 10  # 10 MB
+        backup_count = 3
+
+    return LogConfig()
+
+
+@pytest.fixture
+def structured_logger(memory_log_config):
+    """Create a console-only structured logger."""
+    return StructuredLogger("test", memory_log_config)
+
+
+def test_structured_logger_creation(structured_logger):
     """Test creating a structured logger."""
-    logger = StructuredLogger("test", log_config)
-    assert logger.name == "test"
-    assert logger.logger is not None
+    assert structured_logger.name == "test"
+    assert structured_logger.logger is not None
+
 
+def test_console_handler_output(memory_log_config, capsys):
+    """Test the console handler writes the formatted record to stderr."""
+    # Built inside the test so the handler binds to the captured stderr
+    logger = StructuredLogger("test", memory_log_config)
+    logger.warning("Formatted message")
 
-def test_logger_debug_message(log_config, capsys):
+    err = capsys.readouterr().err
+    assert re.search(
+        r"\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\].* WARNING  test - Formatted message", err
+    )
+
+
+def test_logger_debug_message(structured_logger, caplog):
     """Test debug log message."""
-    logger = StructuredLogger("test", log_config)
-    logger.debug("Debug message")
-    captured = capsys.readouterr()
-    assert "Debug message" in captured.err or "Debug message" in captured.out
+    structured_logger.debug("Debug message")
+    _assert_logged(caplog, logging.DEBUG, "Debug message")
 
 
-def test_logger_info_message(log_config, capsys):
+def test_logger_info_message(structured_logger, caplog):
     """Test info log message."""
-    logger = StructuredLogger("test", log_config)
-    logger.info("Info message")
-    captured = capsys.readouterr()
-    assert "Info message" in captured.err or "Info message" in captured.out
+    structured_logger.info("Info message")
+    _assert_logged(caplog, logging.INFO, "Info message")
 
 
-def test_logger_warning_message(log_config, capsys):
+def test_logger_warning_message(structured_logger, caplog):
     """Test warning log message."""
-    logger = StructuredLogger("test", log_config)
-    logger.warning("Warning message")
-    captured = capsys.readouterr()
-    assert "Warning message" in captured.err or "Warning message" in captured.out
+    structured_logger.warning("Warning message")
+    _assert_logged(caplog, logging.WARNING, "Warning message")
 
 
-def test_logger_error_message(log_config, capsys):
+def test_logger_error_message(structured_logger, caplog):
     """Test error log message."""
-    logger = StructuredLogger("test", log_config)
-    logger.error("Error message")
-    captured = capsys.readouterr()
-    assert "Error message" in captured.err or "Error message" in captured.out
+    structured_logger.error("Error message")
+    _assert_logged(caplog, logging.ERROR, "Error message")
 
 
 def test_logger_file_creation(log_config):
@@ -77,6 +106,26 @@ def test_logger_file_creation(log_config):
     assert log_file.exists() or log_file.parent.exists()
 
 
+def test_logger_without_file_path(structured_logger):
+    """Test that no file handler is attached when file_path is empty."""
+    assert not any(
+        isinstance(handler, logging.FileHandler)
+        for handler in structured_logger.logger.handlers
+    )
+
+
+def test_recreated_logger_replaces_handlers(log_config):
+    """Test recreating a logger closes its old handlers instead of adding more."""
+    old_handlers = list(StructuredLogger("test", log_config).logger.handlers)
+
+    logger = StructuredLogger("test", log_config)
+
+    assert len(logger.logger.handlers) == len(old_handlers)
+    assert not any(handler in logger.logger.handlers for handler in old_handlers)
+    file_handler = next(h for h in old_handlers if isinstance(h, logging.FileHandler))
+    assert file_handler.stream is None
+
+
 def test_get_logger(log_config):
     """Test getting logger instance."""
     logger1 = get_logger("test_app", log_config)
@@ -96,26 +145,21 @@ def test_create_logger(log_config):
     assert logger2 is not None
 
 
-def test_logger_with_format(log_config, capsys):
+def test_logger_with_format(structured_logger, caplog):
     """Test logger with formatted messages."""
-    logger = StructuredLogger("test", log_config)
-    logger.info("Message with %s", "parameter")
+    structured_logger.info("Message with %s", "parameter")
 
-    captured = capsys.readouterr()
-    assert "Message with parameter" in captured.err or "Message with parameter" in captured.out
+    _assert_logged(caplog, logging.INFO, "Message with parameter")
 
 
-def test_logger_exception(log_config, capsys):
+def test_logger_exception(structured_logger, caplog):
     """Test logger exception method."""
-    logger = StructuredLogger("test", log_config)
-
     try:
         raise ValueError("Test error")
     except ValueError:
-        logger.exception("An error occurred")
+        structured_logger.exception("An error occurred")
 
-    captured = capsys.readouterr()
-    assert "An error occurred" in captured.err or "An error occurred" in captured.out
+    _assert_logged(caplog, logging.ERROR, "An error occurred")
 
 
 if __name__ == "__main__":
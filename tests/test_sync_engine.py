@@ -2,19 +2,24 @@
 Tests for synchronization engine.
 """
 
+import subprocess
+import threading
+import time
+
 import pytest
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch, call
-from git import GitCommandError
+from git import GitCommandError, Repo
+from sqlalchemy import select
 
 from src.sync.sync_engine import SyncEngine
 from src.config.config import GitHubConfig, GiteaConfig, SyncConfig
-from src.models import Database, Repository, SyncHistory
+from src.models import Repository, SyncHistory
 
 
-@pytest.fixture
-def configs(tmp_path):
+@pytest.fixture(scope="session")
+def configs(tmp_path_factory):
     """Create test configurations."""
     github_config = GitHubConfig(
         token="test_token",
@@ -28,7 +33,7 @@ def configs(tmp_path):
     )
 
     sync_config = SyncConfig(
-        local_path=str(tmp_path / "repos"),
+        local_path=str(tmp_path_factory.mktemp("repos")),
         interval=3600,
         timeout=300,
         retry_count=3,
@@ -38,318 +43,475 @@ def configs(tmp_path):
     return github_config, gitea_config, sync_config
 
 
+@pytest.fixture(autouse=True)
+def clear_url_caches():
+    """Start every test with empty URL parsing caches."""
+    SyncEngine._normalize_github_url.cache_clear()
+    SyncEngine._extract_owner_and_repo.cache_clear()
+
+
+@pytest.fixture(scope="module")
+def _patched_repo():
+    """Patch the GitPython Repo class used by the engine once per module."""
+    with patch('src.sync.sync_engine.Repo') as repo_class:
+        yield repo_class
+
+
 @pytest.fixture
-def test_db(tmp_path):
-    """Create test database."""
-    db = Database(f"sqlite:///{tmp_path / 'test.db'}")
-    db.init_db()
-    return db
+def mock_repo(_patched_repo):
+    """Patched Repo class with the configuration of earlier tests cleared."""
+    _patched_repo.reset_mock(return_value=True, side_effect=True)
+    return _patched_repo
 
 
 @pytest.fixture
-def sync_engine(configs, test_db):
-    """Create sync engine with mocked clients."""
-    github_config, gitea_config, sync_config = configs
+def make_repo_instance(mock_repo):
+    """Factory for the Repo instance returned by the patched Repo class.
 
-    with patch('src.sync.sync_engine.GitHubClient') as mock_github, \
-         patch('src.sync.sync_engine.GiteaClient') as mock_gitea:
-        mock_github.return_value = MagicMock()
-        mock_gitea.return_value = MagicMock()
+    The instance is specced on ``git.Repo``, so only its real attributes
+    exist. ``remotes_exist`` answers every ``name in repo.remotes`` check.
+    """
+    def make(remotes_exist=False):
+        repo_instance = MagicMock(spec=Repo)
+        repo_instance.remotes.__contains__.return_value = remotes_exist
+        mock_repo.return_value = repo_instance
+        return repo_instance
 
-        engine = SyncEngine(
-            github_config,
-            gitea_config,
-            sync_config,
-            test_db
-        )
+    return make
 
-        engine.github_client = MagicMock()
-        engine.gitea_client = MagicMock()
 
-        yield engine
+@pytest.fixture(scope="module")
+def _patched_clients():
+    """Patch the GitHub and Gitea client classes once per module."""
+    with patch('src.sync.sync_engine.GitHubClient'), \
+         patch('src.sync.sync_engine.GiteaClient'):
+        yield
 
 
-def test_sync_engine_initialization(configs, test_db):
-    """Test SyncEngine initialization."""
+@pytest.fixture
+def sync_engine(configs, isolated_db, _patched_clients):
+    """Create sync engine with mocked clients."""
     github_config, gitea_config, sync_config = configs
 
-    with patch('src.sync.sync_engine.GitHubClient') as mock_github, \
-         patch('src.sync.sync_engine.GiteaClient') as mock_gitea:
-        mock_github.return_value = MagicMock()
-        mock_gitea.return_value = MagicMock()
+    engine = SyncEngine(
+        github_config,
+        gitea_config,
+        sync_config,
+        isolated_db
+    )
 
-        engine = SyncEngine(
-            github_config,
-            gitea_config,
-            sync_config,
-            test_db
-        )
+    engine.github_client = MagicMock()
+    engine.gitea_client = MagicMock()
 
-        assert engine.github_config == github_config
-        assert engine.gitea_config == gitea_config
-        assert engine.sync_config == sync_config
-        assert engine.db == test_db
-        assert engine.local_repo_path.exists()
+    return engine
 
 
-def test_extract_owner_and_repo_https():
-    """Test extracting owner and repo from HTTPS URL."""
-    url = "https://github.com/testuser/test-repo.git"
-    owner, repo = SyncEngine._extract_owner_and_repo(url)
-
-    assert owner == "testuser"
-    assert repo == "test-repo"
+def test_sync_engine_initialization(configs, isolated_db, _patched_clients):
+    """Test SyncEngine initialization."""
+    github_config, gitea_config, sync_config = configs
 
+    engine = SyncEngine(
+        github_config,
+        gitea_config,
+        sync_config,
+        isolated_db
+    )
 
-def test_extract_owner_and_repo_https_no_git():
-    """Test extracting owner and repo from HTTPS URL without .git."""
+    assert engine.github_config == github_config
+    assert engine.gitea_config == gitea_config
+    assert engine.sync_config == sync_config
+    assert engine.db == isolated_db
+    assert engine.local_repo_path.exists()
+
+
+@pytest.mark.parametrize("url", [
+    "https://github.com/testuser/test-repo.git",
+    "https://github.com/testuser/test-repo",
+    "git@github.com:testuser/test-repo.git",
+    "git@github.com:testuser/test-repo",
+], ids=["https", "https_no_git", "ssh", "ssh_no_git"])
+def test_extract_owner_and_repo(url):
+    """Test extracting owner and repo from HTTPS and SSH URLs."""
+    assert SyncEngine._extract_owner_and_repo(url) == ("testuser", "test-repo")
+
+
+@pytest.mark.parametrize("url, message", [
+    ("invalid-url", "Invalid GitHub URL"),
+    ("https://github.com/onlyowner", "Invalid GitHub URL format"),
+], ids=["invalid_format", "missing_parts"])
+def test_extract_owner_and_repo_invalid(url, message):
+    """Test URLs that cannot be parsed."""
+    with pytest.raises(ValueError, match=message):
+        SyncEngine._extract_owner_and_repo(url)
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://github.com/testuser/test-repo.git", "https://github.com/testuser/test-repo.git"),
+    ("https://github.com/testuser/test-repo", "https://github.com/testuser/test-repo.git"),
+    ("https://github.com/testuser/test-repo/", "https://github.com/testuser/test-repo.git"),
+    ("git@github.com:testuser/test-repo", "git@github.com:testuser/test-repo.git"),
+    ("  https://github.com/testuser/test-repo  ", "https://github.com/testuser/test-repo.git"),
+    ("https://gitlab.com/testuser/test-repo", "https://gitlab.com/testuser/test-repo"),
+], ids=["https", "https_no_git", "trailing_slash", "ssh_no_git", "whitespace", "not_github"])
+def test_normalize_github_url(url, expected):
+    """Test GitHub URLs are normalized to end with .git."""
+    assert SyncEngine._normalize_github_url(url) == expected
+
+
+def test_url_helpers_are_cached():
+    """Test URL parsing results are reused for repeated URLs."""
     url = "https://github.com/testuser/test-repo"
-    owner, repo = SyncEngine._extract_owner_and_repo(url)
 
-    assert owner == "testuser"
-    assert repo == "test-repo"
+    for _ in range(3):
+        SyncEngine._extract_owner_and_repo(SyncEngine._normalize_github_url(url))
 
+    assert SyncEngine._normalize_github_url.cache_info().hits == 2
+    assert SyncEngine._extract_owner_and_repo.cache_info().hits == 2
 
-def test_extract_owner_and_repo_ssh():
-    """Test extracting owner and repo from SSH URL."""
-    url = "git@github.com:testuser/test-repo.git"
-    owner, repo = SyncEngine._extract_owner_and_repo(url)
 
-    assert owner == "testuser"
-    assert repo == "test-repo"
+def test_clone_repository_success(sync_engine, mock_repo):
+    """Test successful repository cloning."""
+    mock_repo.clone_from.return_value = MagicMock()
 
+    local_path = sync_engine.local_repo_path / "test-repo"
+    status, output = sync_engine._clone_repository(
+        "https://github.com/testuser/test-repo.git",
+        local_path
+    )
 
-def test_extract_owner_and_repo_ssh_no_git():
-    """Test extracting owner and repo from SSH URL without .git."""
-    url = "git@github.com:testuser/test-repo"
-    owner, repo = SyncEngine._extract_owner_and_repo(url)
+    assert status == "success"
+    assert output == ""
+    mock_repo.clone_from.assert_called_once()
 
-    assert owner == "testuser"
-    assert repo == "test-repo"
 
+@pytest.mark.parametrize("shallow", [False, True], ids=["full", "shallow"])
+def test_clone_repository_shallow(sync_engine, mock_repo, monkeypatch, shallow):
+    """Test shallow clones are only requested when shallow_mirror is set."""
+    monkeypatch.setattr(sync_engine.sync_config, "shallow_mirror", shallow)
 
-def test_extract_owner_and_repo_invalid_format():
-    """Test invalid URL format."""
-    with pytest.raises(ValueError, match="Invalid GitHub URL"):
-        SyncEngine._extract_owner_and_repo("invalid-url")
+    sync_engine._clone_repository(
+        "https://github.com/testuser/test-repo.git",
+        sync_engine.local_repo_path / "test-repo"
+    )
 
+    multi_options = mock_repo.clone_from.call_args.kwargs["multi_options"]
+    assert ("--depth=1" in multi_options) is shallow
+    assert ("--no-single-branch" in multi_options) is shallow
 
-def test_extract_owner_and_repo_missing_parts():
-    """Test URL with missing parts."""
-    with pytest.raises(ValueError, match="Invalid GitHub URL format"):
-        SyncEngine._extract_owner_and_repo("https://github.com/onlyowner")
 
+def test_clone_repository_git_error(sync_engine, mock_repo):
+    """Test clone failure due to git error."""
+    mock_repo.clone_from.side_effect = GitCommandError(
+        "git clone",
+        1,
+        stderr="Repository not found"
+    )
 
-def test_clone_repository_success(sync_engine):
-    """Test successful repository cloning."""
-    with patch('src.sync.sync_engine.Repo') as mock_repo:
-        mock_repo.clone_from.return_value = MagicMock()
+    local_path = sync_engine.local_repo_path / "test-repo"
+    status, output = sync_engine._clone_repository(
+        "https://github.com/testuser/nonexistent.git",
+        local_path
+    )
+
+    assert status == "failed"
+    assert "Git command error" in output
 
-        local_path = sync_engine.local_repo_path / "test-repo"
+
+def test_clone_repository_retries_transient_error(sync_engine, mock_repo):
+    """Test clone is retried after a transient network error."""
+    mock_repo.clone_from.side_effect = [
+        GitCommandError("git clone", 128, stderr="RPC failed; curl 18"),
+        MagicMock()
+    ]
+
+    local_path = sync_engine.local_repo_path / "test-repo"
+    with patch('src.sync.sync_engine.time.sleep') as mock_sleep:
         status, output = sync_engine._clone_repository(
             "https://github.com/testuser/test-repo.git",
             local_path
         )
 
-        assert status == "success"
-        assert output == ""
-        mock_repo.clone_from.assert_called_once()
+    assert status == "success"
+    assert mock_repo.clone_from.call_count == 2
+    mock_sleep.assert_called_once_with(5)
 
 
-def test_clone_repository_git_error(sync_engine):
-    """Test clone failure due to git error."""
-    with patch('src.sync.sync_engine.Repo') as mock_repo:
-        mock_repo.clone_from.side_effect = GitCommandError(
-            "git clone",
-            1,
-            stderr="Repository not found"
-        )
+def test_clone_repository_general_error(sync_engine, mock_repo):
+    """Test clone failure due to general error."""
+    mock_repo.clone_from.side_effect = Exception("General error")
 
-        local_path = sync_engine.local_repo_path / "test-repo"
-        status, output = sync_engine._clone_repository(
-            "https://github.com/testuser/nonexistent.git",
-            local_path
-        )
+    local_path = sync_engine.local_repo_path / "test-repo"
+    status, output = sync_engine._clone_repository(
+        "https://github.com/testuser/test-repo.git",
+        local_path
+    )
 
-        assert status == "failed"
-        assert "Git command error" in output
+    assert status == "failed"
+    assert "Clone failed" in output
 
 
-def test_clone_repository_general_error(sync_engine):
-    """Test clone failure due to general error."""
-    with patch('src.sync.sync_engine.Repo') as mock_repo:
-        mock_repo.clone_from.side_effect = Exception("General error")
+def test_clone_repository_uses_cache(sync_engine, mock_repo, monkeypatch, tmp_path):
+    """Test clones borrow objects from the cached mirror when enabled."""
+    monkeypatch.setattr(sync_engine.sync_config, "clone_cache", True)
+    sync_engine.clone_cache_path = tmp_path / "cache"
+    url = "https://github.com/testuser/test-repo.git"
+    local_path = sync_engine.local_repo_path / "test-repo"
+
+    # First clone: the mirror is created, then the repository is cloned from it
+    status, _ = sync_engine._clone_repository(url, local_path)
+    assert status == "success"
+    (cache_call, clone_call) = mock_repo.clone_from.call_args_list
+    assert cache_call.args[1].parent == sync_engine.clone_cache_path
+    assert cache_call.kwargs["mirror"] is True
+    cache_path = Path(clone_call.kwargs["reference_if_able"])
+    assert cache_path.parent == sync_engine.clone_cache_path
+    assert cache_path.is_dir()
+    assert clone_call.kwargs["dissociate"] is True
+
+    # Second clone: the existing mirror is only fetched
+    mock_repo.clone_from.reset_mock()
+    status, _ = sync_engine._clone_repository(url, local_path)
+    assert status == "success"
+    mock_repo.assert_called_once_with(cache_path)
+    mock_repo.return_value.remotes.origin.fetch.assert_called_once()
+    mock_repo.clone_from.assert_called_once()
+    assert mock_repo.clone_from.call_args.kwargs["reference_if_able"] == str(cache_path)
+
+
+def test_clone_repository_cache_failure(sync_engine, mock_repo, monkeypatch, tmp_path):
+    """Test clone falls back to a direct clone when the mirror cannot be created."""
+    monkeypatch.setattr(sync_engine.sync_config, "clone_cache", True)
+    sync_engine.clone_cache_path = tmp_path / "cache"
+    mock_repo.clone_from.side_effect = [
+        GitCommandError("git clone", 128, stderr="Repository not found"),
+        MagicMock()
+    ]
 
-        local_path = sync_engine.local_repo_path / "test-repo"
-        status, output = sync_engine._clone_repository(
-            "https://github.com/testuser/test-repo.git",
-            local_path
-        )
+    status, _ = sync_engine._clone_repository(
+        "https://github.com/testuser/test-repo.git",
+        sync_engine.local_repo_path / "test-repo"
+    )
 
-        assert status == "failed"
-        assert "Clone failed" in output
+    assert status == "success"
+    assert "reference_if_able" not in mock_repo.clone_from.call_args.kwargs
+
+
+def test_clone_cache_outside_repository_directory(sync_engine):
+    """Test a repository named .cache cannot collide with the clone cache."""
+    assert not sync_engine.clone_cache_path.is_relative_to(sync_engine.local_repo_path.resolve())
+
+
+def test_clone_cache_failure_leaves_no_mirror(sync_engine, mock_repo, tmp_path):
+    """Test a failed mirror clone is discarded instead of being reused later."""
+    sync_engine.clone_cache_path = tmp_path / "cache"
+
+    def fail_midway(url, path, **kwargs):
+        (Path(path) / "HEAD").write_text("partial")
+        raise GitCommandError("git clone", 128, stderr="RPC failed")
+
+    mock_repo.clone_from.side_effect = fail_midway
+
+    assert sync_engine._refresh_clone_cache("https://github.com/testuser/test-repo.git") is None
+    assert list(sync_engine.clone_cache_path.iterdir()) == []
 
 
-def test_update_repository_success(sync_engine, tmp_path):
+def test_clone_cache_same_url_serialized(sync_engine, mock_repo, tmp_path):
+    """Test concurrent refreshes of one URL create the mirror only once."""
+    sync_engine.clone_cache_path = tmp_path / "cache"
+    url = "https://github.com/testuser/test-repo.git"
+    cloning = threading.Event()
+
+    def slow_clone(url, path, **kwargs):
+        cloning.set()
+        time.sleep(0.05)
+
+    mock_repo.clone_from.side_effect = slow_clone
+
+    first = threading.Thread(target=sync_engine._refresh_clone_cache, args=(url,))
+    first.start()
+    cloning.wait()
+    second = sync_engine._refresh_clone_cache(url)
+    first.join()
+
+    mock_repo.clone_from.assert_called_once()
+    mock_repo.return_value.remotes.origin.fetch.assert_called_once()
+    assert second.is_dir()
+
+
+def test_update_repository_success(sync_engine, make_repo_instance, tmp_path):
     """Test successful repository update."""
     local_path = tmp_path / "test-repo"
     local_path.mkdir()
 
-    with patch('src.sync.sync_engine.Repo') as mock_repo:
-        mock_repo_instance = MagicMock()
-        mock_repo.return_value = mock_repo_instance
-        mock_repo_instance.remotes = MagicMock()
-        mock_repo_instance.remotes.origin = MagicMock()
-        mock_repo_instance.remotes.__contains__ = MagicMock(return_value=True)
+    make_repo_instance(remotes_exist=True)
 
-        status, output = sync_engine._update_repository(
-            local_path,
-            "https://github.com/testuser/test-repo.git"
-        )
+    status, output = sync_engine._update_repository(
+        local_path,
+        "https://github.com/testuser/test-repo.git"
+    )
 
-        assert status == "success"
-        assert output == ""
+    assert status == "success"
+    assert output == ""
 
 
-def test_update_repository_create_remote(sync_engine, tmp_path):
+def test_update_repository_create_remote(sync_engine, make_repo_instance, tmp_path):
     """Test update creating remote if it doesn't exist."""
     local_path = tmp_path / "test-repo"
     local_path.mkdir()
 
-    with patch('src.sync.sync_engine.Repo') as mock_repo:
-        mock_repo_instance = MagicMock()
-        mock_repo.return_value = mock_repo_instance
-        mock_repo_instance.remotes.__contains__ = MagicMock(return_value=False)
-        mock_repo_instance.create_remote = MagicMock()
+    mock_repo_instance = make_repo_instance(remotes_exist=False)
 
-        status, output = sync_engine._update_repository(
-            local_path,
-            "https://github.com/testuser/test-repo.git"
-        )
+    status, output = sync_engine._update_repository(
+        local_path,
+        "https://github.com/testuser/test-repo.git"
+    )
 
-        assert status == "success"
-        mock_repo_instance.create_remote.assert_called_once()
+    assert status == "success"
+    mock_repo_instance.create_remote.assert_called_once()
 
 
-def test_update_repository_git_error(sync_engine, tmp_path):
+def test_update_repository_git_error(sync_engine, mock_repo, tmp_path):
     """Test update failure due to git error."""
     local_path = tmp_path / "test-repo"
     local_path.mkdir()
 
-    with patch('src.sync.sync_engine.Repo') as mock_repo:
-        mock_repo.side_effect = GitCommandError(
-            "git fetch",
-            1,
-            stderr="Connection refused"
-        )
+    mock_repo.side_effect = GitCommandError(
+        "git fetch",
+        1,
+        stderr="Connection refused"
+    )
 
-        status, output = sync_engine._update_repository(
-            local_path,
-            "https://github.com/testuser/test-repo.git"
-        )
+    status, output = sync_engine._update_repository(
+        local_path,
+        "https://github.com/testuser/test-repo.git"
+    )
 
-        assert status == "failed"
-        assert "Git command error" in output
+    assert status == "failed"
+    assert "Git command error" in output
 
 
-def test_push_to_gitea_success(sync_engine, tmp_path):
+def test_push_to_gitea_success(sync_engine, make_repo_instance, tmp_path):
     """Test successful push to Gitea."""
     local_path = tmp_path / "test-repo"
     local_path.mkdir()
 
-    with patch('src.sync.sync_engine.Repo') as mock_repo:
-        mock_repo_instance = MagicMock()
-        mock_repo.return_value = mock_repo_instance
-        mock_repo_instance.remotes.__contains__ = MagicMock(return_value=False)
-        mock_repo_instance.create_remote = MagicMock()
-        mock_repo_instance.remotes.gitea = MagicMock()
-
-        status, output = sync_engine._push_to_gitea(
-            local_path,
-            "testuser",
-            "test-repo"
-        )
+    make_repo_instance(remotes_exist=False)
 
-        assert status == "success"
-        assert output == ""
+    status, output = sync_engine._push_to_gitea(
+        local_path,
+        "testuser",
+        "test-repo"
+    )
+
+    assert status == "success"
+    assert output == ""
 
 
-def test_push_to_gitea_set_existing_url(sync_engine, tmp_path):
+def test_push_to_gitea_set_existing_url(sync_engine, make_repo_instance, tmp_path):
     """Test push to Gitea updating existing remote URL."""
     local_path = tmp_path / "test-repo"
     local_path.mkdir()
 
-    with patch('src.sync.sync_engine.Repo') as mock_repo:
-        mock_repo_instance = MagicMock()
-        mock_repo.return_value = mock_repo_instance
-        mock_repo_instance.remotes.__contains__ = MagicMock(return_value=True)
-        mock_repo_instance.remotes.gitea = MagicMock()
+    mock_repo_instance = make_repo_instance(remotes_exist=True)
 
-        sync_engine._push_to_gitea(
-            local_path,
-            "testuser",
-            "test-repo"
-        )
+    sync_engine._push_to_gitea(
+        local_path,
+        "testuser",
+        "test-repo"
+    )
 
-        mock_repo_instance.remotes.gitea.set_url.assert_called_once()
+    mock_repo_instance.remotes.gitea.set_url.assert_called_once()
 
 
-def test_push_to_gitea_no_refs_to_push(sync_engine, tmp_path):
+def test_push_to_gitea_no_refs_to_push(sync_engine, make_repo_instance, tmp_path):
     """Test push when there are no refs to push."""
     local_path = tmp_path / "test-repo"
     local_path.mkdir()
 
-    with patch('src.sync.sync_engine.Repo') as mock_repo:
-        mock_repo_instance = MagicMock()
-        mock_repo.return_value = mock_repo_instance
-        mock_repo_instance.remotes.__contains__ = MagicMock(return_value=False)
-        mock_repo_instance.create_remote = MagicMock()
-        mock_repo_instance.remotes.gitea = MagicMock()
-        mock_repo_instance.remotes.gitea.push.side_effect = GitCommandError(
-            "git push",
-            1,
-            stderr="No refs to push"
-        )
+    mock_repo_instance = make_repo_instance(remotes_exist=False)
+    mock_repo_instance.remotes.gitea.push.side_effect = GitCommandError(
+        "git push",
+        1,
+        stderr="No refs to push"
+    )
 
-        status, output = sync_engine._push_to_gitea(
-            local_path,
-            "testuser",
-            "test-repo"
-        )
+    status, output = sync_engine._push_to_gitea(
+        local_path,
+        "testuser",
+        "test-repo"
+    )
 
-        assert status == "success"
+    assert status == "success"
 
 
-def test_push_to_gitea_error(sync_engine, tmp_path):
+def test_push_to_gitea_error(sync_engine, make_repo_instance, tmp_path):
     """Test push failure."""
     local_path = tmp_path / "test-repo"
     local_path.mkdir()
 
-    with patch('src.sync.sync_engine.Repo') as mock_repo:
-        mock_repo_instance = MagicMock()
-        mock_repo.return_value = mock_repo_instance
-        mock_repo_instance.remotes.__contains__ = MagicMock(return_value=False)
-        mock_repo_instance.create_remote = MagicMock()
-        mock_repo_instance.remotes.gitea = MagicMock()
-        mock_repo_instance.remotes.gitea.push.side_effect = GitCommandError(
-            "git push",
-            1,
-            stderr="Permission denied"
-        )
+    mock_repo_instance = make_repo_instance(remotes_exist=False)
+    mock_repo_instance.remotes.gitea.push.side_effect = GitCommandError(
+        "git push",
+        1,
+        stderr="Permission denied"
+    )
 
-        status, output = sync_engine._push_to_gitea(
-            local_path,
-            "testuser",
-            "test-repo"
-        )
+    status, output = sync_engine._push_to_gitea(
+        local_path,
+        "testuser",
+        "test-repo"
+    )
+
+    assert status == "failed"
+    assert "Git command error" in output
 
+
+def _git(*args, cwd=None):
+    """Run a real git command for tests that need an actual repository."""
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True
+    )
+
+
+@pytest.mark.parametrize("shallow_update", [True, False], ids=["allowed", "rejected"])
+def test_push_to_gitea_from_shallow_clone(sync_engine, monkeypatch, tmp_path, shallow_update):
+    """Test pushing a shallow clone to a bare target with and without shallow updates."""
+    source = tmp_path / "source"
+    _git("init", "-q", "-b", "main", str(source))
+    for message in ("first", "second"):
+        _git("commit", "-q", "--allow-empty", "-m", message, cwd=source)
+
+    local_path = tmp_path / "test-repo"
+    _git("clone", "-q", "--depth=1", "--no-single-branch", source.as_uri(), str(local_path))
+    assert (local_path / ".git" / "shallow").exists()
+
+    target = tmp_path / "gitea" / "testuser" / "test-repo.git"
+    _git("init", "-q", "--bare", str(target))
+    _git("config", "receive.shallowUpdate", str(shallow_update).lower(), cwd=target)
+
+    monkeypatch.setattr("src.sync.sync_engine.Repo", Repo)
+    monkeypatch.setattr(sync_engine, "gitea_config", GiteaConfig(
+        url=(tmp_path / "gitea").as_uri(),
+        username="testuser",
+        token=""
+    ))
+
+    status, output = sync_engine._push_to_gitea(local_path, "testuser", "test-repo")
+
+    if shallow_update:
+        assert status == "success"
+        assert Repo(target).heads.main.commit.message.strip() == "second"
+    else:
         assert status == "failed"
-        assert "Git command error" in output
+        assert "SYNC_SHALLOW_MIRROR" in output
 
 
-def test_record_sync_history(sync_engine, test_db):
+def test_record_sync_history(sync_engine, isolated_db):
     """Test recording sync history."""
-    session = test_db.get_session()
+    session = isolated_db.get_session()
 
     sync_engine._record_sync_history(
         session,
@@ -364,13 +526,16 @@ def test_record_sync_history(sync_engine, test_db):
     assert history[0].repository_name == "test-repo"
     assert history[0].status == "success"
     assert history[0].duration_seconds == 10.5
+    # Column defaults are applied to the plain INSERT as well
+    assert history[0].created_at is not None
+    assert history[0].files_added == 0
 
     session.close()
 
 
-def test_record_sync_history_with_error(sync_engine, test_db):
+def test_record_sync_history_with_error(sync_engine, isolated_db):
     """Test recording failed sync history."""
-    session = test_db.get_session()
+    session = isolated_db.get_session()
 
     sync_engine._record_sync_history(
         session,
@@ -389,19 +554,16 @@ def test_record_sync_history_with_error(sync_engine, test_db):
     session.close()
 
 
-def test_sync_repository_clone_new(sync_engine):
+@pytest.mark.slow
+def test_sync_repository_clone_new(sync_engine, mock_repo, make_repo_instance):
     """Test syncing a new repository (clone operation)."""
     sync_engine.gitea_client.repository_exists.return_value = False
     sync_engine.gitea_client.create_repository.return_value = {"id": 1}
 
-    with patch('src.sync.sync_engine.Repo') as mock_repo, \
-         patch.object(Path, 'exists') as mock_exists:
+    with patch.object(Path, 'exists') as mock_exists:
         mock_exists.side_effect = [False, False]  # Repo doesn't exist locally
         mock_repo.clone_from.return_value = MagicMock()
-        mock_repo_instance = MagicMock()
-        mock_repo.return_value = mock_repo_instance
-        mock_repo_instance.remotes.__contains__ = MagicMock(return_value=False)
-        mock_repo_instance.remotes.gitea = MagicMock()
+        make_repo_instance(remotes_exist=False)
 
         result = sync_engine.sync_repository(
             "test-repo",
@@ -413,19 +575,14 @@ def test_sync_repository_clone_new(sync_engine):
         assert "test-repo" in result["repository"]
 
 
-def test_sync_repository_update_existing(sync_engine):
+@pytest.mark.slow
+def test_sync_repository_update_existing(sync_engine, make_repo_instance):
     """Test syncing existing repository (update operation)."""
     sync_engine.gitea_client.repository_exists.return_value = True
 
-    with patch('src.sync.sync_engine.Repo') as mock_repo, \
-         patch.object(Path, 'exists') as mock_exists:
+    with patch.object(Path, 'exists') as mock_exists:
         mock_exists.return_value = True  # Repo exists locally
-        mock_repo_instance = MagicMock()
-        mock_repo.return_value = mock_repo_instance
-        mock_repo_instance.remotes = MagicMock()
-        mock_repo_instance.remotes.origin = MagicMock()
-        mock_repo_instance.remotes.gitea = MagicMock()
-        mock_repo_instance.remotes.__contains__ = MagicMock(return_value=True)
+        make_repo_instance(remotes_exist=True)
 
         result = sync_engine.sync_repository(
             "test-repo",
@@ -436,12 +593,12 @@ def test_sync_repository_update_existing(sync_engine):
         assert result["operation_type"] == "update"
 
 
-def test_sync_repository_failure(sync_engine):
+@pytest.mark.slow
+def test_sync_repository_failure(sync_engine, mock_repo):
     """Test sync failure handling."""
     sync_engine.gitea_client.repository_exists.return_value = True
 
-    with patch('src.sync.sync_engine.Repo') as mock_repo, \
-         patch.object(Path, 'exists') as mock_exists:
+    with patch.object(Path, 'exists') as mock_exists:
         mock_exists.return_value = True
         mock_repo.side_effect = Exception("Clone failed")
 
@@ -454,31 +611,66 @@ def test_sync_repository_failure(sync_engine):
         assert "error" in result
 
 
-def test_sync_all_success(sync_engine, test_db):
+@pytest.mark.slow
+def test_sync_repository_overlaps_gitea_and_clone(sync_engine, mock_repo):
+    """Test the Gitea repository check runs while the repository is cloned."""
+    clone_started = threading.Event()
+    overlapped = []
+
+    def clone_from(*args, **kwargs):
+        clone_started.set()
+        return MagicMock()
+
+    def repository_exists(owner, name):
+        overlapped.append(clone_started.wait(timeout=5))
+        return True
+
+    mock_repo.clone_from.side_effect = clone_from
+    sync_engine.gitea_client.repository_exists.side_effect = repository_exists
+
+    sync_engine.sync_repository(
+        "overlap-repo",
+        "https://github.com/testuser/overlap-repo.git"
+    )
+
+    assert overlapped == [True]
+
+
+@pytest.mark.slow
+def test_sync_repository_gitea_error(sync_engine, mock_repo):
+    """Test a Gitea failure fails the sync even though the clone succeeded."""
+    sync_engine.gitea_client.repository_exists.side_effect = Exception("Gitea unavailable")
+    mock_repo.clone_from.return_value = MagicMock()
+
+    result = sync_engine.sync_repository(
+        "gitea-error-repo",
+        "https://github.com/testuser/gitea-error-repo.git"
+    )
+
+    assert result["status"] == "failed"
+    assert result["error"] == "Gitea unavailable"
+
+
+@pytest.mark.slow
+def test_sync_all_success(sync_engine, isolated_db, mock_repo, make_repo_instance):
     """Test syncing all repositories."""
-    session = test_db.get_session()
+    session = isolated_db.get_session()
 
     # Add test repositories
-    repos = [
+    session.bulk_save_objects([
         Repository(name="repo1", owner="user", url="https://github.com/user/repo1.git"),
         Repository(name="repo2", owner="user", url="https://github.com/user/repo2.git"),
-    ]
-    session.add_all(repos)
+    ])
     session.commit()
     session.close()
 
     sync_engine.gitea_client.repository_exists.return_value = False
     sync_engine.gitea_client.create_repository.return_value = {"id": 1}
 
-    with patch('src.sync.sync_engine.Repo') as mock_repo, \
-         patch.object(Path, 'exists') as mock_exists:
+    with patch.object(Path, 'exists') as mock_exists:
         mock_exists.return_value = False  # Repos don't exist locally
         mock_repo.clone_from.return_value = MagicMock()
-        mock_repo_instance = MagicMock()
-        mock_repo.return_value = mock_repo_instance
-        mock_repo_instance.remotes = MagicMock()
-        mock_repo_instance.remotes.gitea = MagicMock()
-        mock_repo_instance.remotes.__contains__ = MagicMock(return_value=False)
+        make_repo_instance(remotes_exist=False)
 
         result = sync_engine.sync_all()
 
@@ -487,8 +679,11 @@ def test_sync_all_success(sync_engine, test_db):
         assert result["failed"] == 0
 
 
-def test_sync_all_partial_failure(sync_engine):
+@pytest.mark.slow
+def test_sync_all_partial_failure(sync_engine, mock_repo, make_repo_instance, monkeypatch):
     """Test sync_all with partial failures."""
+    # Path.exists and clone_from answer in call order; sync one at a time
+    monkeypatch.setattr(sync_engine.sync_config, "concurrent_tasks", 1)
     repos = [
         {"name": "repo1", "url": "https://github.com/user/repo1.git"},
         {"name": "repo2", "url": "https://github.com/user/repo2.git"},
@@ -497,15 +692,10 @@ def test_sync_all_partial_failure(sync_engine):
     sync_engine.gitea_client.repository_exists.return_value = False
     sync_engine.gitea_client.create_repository.return_value = {"id": 1}
 
-    with patch('src.sync.sync_engine.Repo') as mock_repo, \
-         patch.object(Path, 'exists') as mock_exists:
+    with patch.object(Path, 'exists') as mock_exists:
         mock_exists.side_effect = [False, Exception("Clone failed")]
         mock_repo.clone_from.side_effect = [MagicMock(), Exception("Clone failed")]
-        mock_repo_instance = MagicMock()
-        mock_repo.return_value = mock_repo_instance
-        mock_repo_instance.remotes = MagicMock()
-        mock_repo_instance.remotes.gitea = MagicMock()
-        mock_repo_instance.remotes.__contains__ = MagicMock(return_value=False)
+        make_repo_instance(remotes_exist=False)
 
         result = sync_engine.sync_all(repos)
 
@@ -514,6 +704,98 @@ def test_sync_all_partial_failure(sync_engine):
         assert result["success"] >= 0
 
 
+def test_sync_all_concurrent(sync_engine, monkeypatch):
+    """Test sync_all syncs repositories in parallel and keeps their order."""
+    repos = [
+        {"name": f"repo{i}", "url": f"https://github.com/user/repo{i}.git"}
+        for i in range(3)
+    ]
+    # Only passes if all three syncs are running at the same time
+    barrier = threading.Barrier(len(repos), timeout=5)
+
+    def sync_repository(repo_name, github_url, gitea_owner=None, gitea_org=None):
+        barrier.wait()
+        return {"status": "success", "repository": repo_name}
+
+    monkeypatch.setattr(sync_engine, "sync_repository", sync_repository)
+
+    result = sync_engine.sync_all(repos)
+
+    assert result["success"] == 3
+    assert [r["repository"] for r in result["repositories"]] == ["repo0", "repo1", "repo2"]
+
+
+@pytest.mark.slow
+def test_sync_all_concurrent_database_writes(sync_engine, isolated_db, mock_repo, monkeypatch):
+    """Test parallel syncs record their history and status in the shared database."""
+    monkeypatch.setattr(sync_engine.sync_config, "concurrent_tasks", 3)
+    names = [f"parallel{i}" for i in range(3)]
+    with isolated_db.session_scope() as session:
+        session.add_all([
+            Repository(name=name, owner="user", url=f"https://github.com/user/{name}.git")
+            for name in names
+        ])
+
+    sync_engine.gitea_client.repository_exists.return_value = True
+    mock_repo.clone_from.return_value = MagicMock()
+    # All three syncs reach their database writes at the same time
+    barrier = threading.Barrier(len(names), timeout=5)
+
+    def push_to_gitea(local_path, gitea_owner, repo_name, timeout=1800):
+        barrier.wait()
+        return "success", ""
+
+    monkeypatch.setattr(sync_engine, "_push_to_gitea", push_to_gitea)
+
+    result = sync_engine.sync_all()
+
+    assert result["success"] == 3
+    with isolated_db.session_scope() as session:
+        history = session.scalars(
+            select(SyncHistory.repository_name).where(SyncHistory.repository_name.in_(names))
+        ).all()
+        statuses = session.scalars(
+            select(Repository.last_sync_status).where(Repository.name.in_(names))
+        ).all()
+    assert sorted(history) == names
+    assert statuses == ["success"] * 3
+
+
+def test_sync_all_same_name_sequential(sync_engine, monkeypatch):
+    """Test repositories sharing a local clone are synced by the same worker."""
+    repos = [
+        {"name": "repo", "url": "https://github.com/user/repo.git"},
+        {"name": "other", "url": "https://github.com/user/other.git"},
+        {"name": "repo", "url": "https://github.com/user/repo.git", "gitea_owner": "org"},
+    ]
+    workers = []
+
+    def sync_repository(repo_name, github_url, gitea_owner=None, gitea_org=None):
+        workers.append((repo_name, gitea_org, threading.current_thread().name))
+        return {"status": "success", "repository": repo_name}
+
+    monkeypatch.setattr(sync_engine, "sync_repository", sync_repository)
+
+    result = sync_engine.sync_all(repos)
+
+    assert result["success"] == 3
+    repo_workers = [(org, worker) for name, org, worker in workers if name == "repo"]
+    # Synced in input order, on one thread
+    assert [org for org, _ in repo_workers] == [None, "org"]
+    assert repo_workers[0][1] == repo_workers[1][1]
+
+
+def test_calculate_directory_size(sync_engine, tmp_path):
+    """Test directory size sums nested files and skips broken symlinks."""
+    (tmp_path / "objects" / "pack").mkdir(parents=True)
+    (tmp_path / "HEAD").write_bytes(b"x" * 1024 * 1024)
+    (tmp_path / "objects" / "pack" / "pack-1.pack").write_bytes(b"x" * 1024 * 1024)
+    (tmp_path / "dangling").symlink_to(tmp_path / "missing")
+
+    assert sync_engine._calculate_directory_size(tmp_path) == 2.0
+    assert sync_engine._calculate_directory_size(tmp_path / "missing") == 0.0
+
+
 def test_sync_all_empty_list(sync_engine):
     """Test sync_all with empty repository list."""
     result = sync_engine.sync_all([])
@@ -539,20 +821,16 @@ def test_close_with_error(sync_engine):
     sync_engine.close()
 
 
-def test_sync_with_custom_gitea_owner(sync_engine):
+@pytest.mark.slow
+def test_sync_with_custom_gitea_owner(sync_engine, mock_repo, make_repo_instance):
     """Test sync with custom Gitea owner."""
     sync_engine.gitea_client.repository_exists.return_value = False
     sync_engine.gitea_client.create_repository.return_value = {"id": 1}
 
-    with patch('src.sync.sync_engine.Repo') as mock_repo, \
-         patch.object(Path, 'exists') as mock_exists:
+    with patch.object(Path, 'exists') as mock_exists:
         mock_exists.return_value = False
         mock_repo.clone_from.return_value = MagicMock()
-        mock_repo_instance = MagicMock()
-        mock_repo.return_value = mock_repo_instance
-        mock_repo_instance.remotes = MagicMock()
-        mock_repo_instance.remotes.gitea = MagicMock()
-        mock_repo_instance.remotes.__contains__ = MagicMock(return_value=False)
+        make_repo_instance(remotes_exist=False)
 
         result = sync_engine.sync_repository(
             "test-repo",
@@ -0,0 +1,115 @@
+"""
+Tests for the task scheduler and its API routes.
+"""
+
+import orjson
+import pytest
+from fastapi import HTTPException
+
+from src.config.config import GitHubConfig, GiteaConfig, SyncConfig
+from src.scheduler.task_scheduler import TaskScheduler
+from src.web.routes import tasks
+
+
+@pytest.fixture
+def make_scheduler(test_db, tmp_path):
+    """Factory for started task schedulers, shut down after the test."""
+    schedulers = []
+
+    def make():
+        scheduler = TaskScheduler(
+            GitHubConfig(token="test_token"),
+            GiteaConfig(url="https://gitea.example.com", username="testuser", token="test_token"),
+            SyncConfig(local_path=str(tmp_path / "repos")),
+            test_db
+        )
+        scheduler.start()
+        schedulers.append(scheduler)
+        return scheduler
+
+    yield make
+    for scheduler in schedulers:
+        scheduler.close()
+
+
+@pytest.fixture
+def scheduler(make_scheduler):
+    """Started task scheduler without jobs."""
+    return make_scheduler()
+
+
+@pytest.fixture(autouse=True)
+def clear_jobs_cache(monkeypatch):
+    """Start every test with an empty job listing cache."""
+    monkeypatch.setattr(tasks, "_jobs_cache", {"key": None, "expires_at": 0.0, "content": b"[]"})
+
+
+async def _list_jobs(scheduler):
+    """Job listing as returned by the API."""
+    response = await tasks.list_tasks(scheduler)
+    return orjson.loads(response.body)
+
+
+def test_jobs_version_bumped_on_changes(scheduler):
+    """Test adding, pausing, resuming and removing a job bump jobs_version."""
+    versions = [scheduler.jobs_version]
+
+    scheduler.schedule_sync(interval_seconds=60)
+    versions.append(scheduler.jobs_version)
+    assert scheduler.pause_job("sync_all_repositories")
+    versions.append(scheduler.jobs_version)
+    assert scheduler.resume_job("sync_all_repositories")
+    versions.append(scheduler.jobs_version)
+    assert scheduler.unschedule_job("sync_all_repositories")
+    versions.append(scheduler.jobs_version)
+
+    assert versions == sorted(set(versions))
+
+
+def test_missing_job(scheduler):
+    """Test unknown job ids are reported without changing jobs_version."""
+    version = scheduler.jobs_version
+
+    assert scheduler.pause_job("missing") is False
+    assert scheduler.resume_job("missing") is False
+    assert scheduler.unschedule_job("missing") is False
+    assert scheduler.jobs_version == version
+
+
+async def test_list_tasks_cache_dropped_on_changes(scheduler):
+    """Test the cached job listing is rebuilt after add, pause and remove."""
+    assert await _list_jobs(scheduler) == []
+
+    scheduler.schedule_sync(interval_seconds=60)
+    (job,) = await _list_jobs(scheduler)
+    assert job["id"] == "sync_all_repositories"
+    assert job["next_run_time"] is not None
+
+    scheduler.pause_job("sync_all_repositories")
+    (job,) = await _list_jobs(scheduler)
+    assert job["next_run_time"] is None
+
+    scheduler.unschedule_job("sync_all_repositories")
+    assert await _list_jobs(scheduler) == []
+
+
+async def test_list_tasks_cache_per_scheduler(make_scheduler):
+    """Test a listing cached for one scheduler is not served for another."""
+    first = make_scheduler()
+    second = make_scheduler()
+    first.schedule_sync(interval_seconds=60)
+    second.jobs_version = first.jobs_version
+
+    assert len(await _list_jobs(first)) == 1
+    # Keyed on the scheduler itself, whose id() could be reused once freed
+    assert tasks._jobs_cache["key"][0] is first
+    assert await _list_jobs(second) == []
+
+
+@pytest.mark.parametrize("route", [tasks.get_task_status, tasks.pause_task, tasks.resume_task])
+async def test_missing_task_not_found(scheduler, route):
+    """Test routes for an unknown job id answer 404."""
+    with pytest.raises(HTTPException) as exc_info:
+        await route("missing", scheduler)
+
+    assert exc_info.value.status_code == 404